@@ -1,10 +1,10 @@
-import json
 import os
 from sys import platform
 from dataclasses import dataclass, asdict
 from typing import Optional
 
 from src.books.core.log import Log
+from src.books.core.utils import readJson, writeJson
 
 @dataclass
 class Config:
@@ -58,10 +58,13 @@ class Config:
         return os.path.join(os.getenv('HOME'), '.config', 'books', 'config.json')
 
     @staticmethod
-    def _createDefaultConfig() -> None:
+    def _createDefaultConfig() -> 'Config':
         """
         Creates a default configuration file if none exists.
         The file is written in JSON format to the appropriate directory based on the platform.
+
+        :return: The default configuration.
+        :rtype: Config
         """
         path = Config.configPath()
         os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -74,9 +77,10 @@ class Config:
         )
         Log.info(f"Creating default config at {path}\n{asdict(config)}")
 
-        # Write the default configuration to the file in JSON format
-        with open(path, 'w', encoding="utf-8") as file:
-            json.dump(asdict(config), file, indent=4)
+        # Write the default configuration to a file in JSON format
+        writeJson(path, asdict(config))
+
+        return config
 
     @staticmethod
     def _loadConfig() -> 'Config':
@@ -89,14 +93,14 @@ class Config:
         """
         path = Config.configPath()
         if not os.path.exists(path):
-            Config._createDefaultConfig()
+            # The default configuration was just written; there is no need to read it back
+            return Config._createDefaultConfig()
         Log.info(f"Loading config from {path}")
 
         # Read configuration from file
-        with open(path, 'r', encoding="utf-8") as file:
-            data = json.load(file)
-            Log.info(f"Loaded config: {data}")
-            return Config(**data)
+        data = readJson(path)
+        Log.info(f"Loaded config: {data}")
+        return Config(**data)
 
 
 def getEbookViewerPath() -> str:
@@ -11,7 +11,9 @@ ebookFormats = {
     "Text Files": "txt"
 }
 
-ebookExtensions = list(ebookFormats.values())
+ebookExtensions = tuple(ebookFormats.values())
+
+ebookSuffixes = tuple(f".{ext}" for ext in ebookExtensions)
 
 allFormatsFilter = "All Formats (" + " ".join(f"*.{ext}" for ext in ebookExtensions) + ")"
 
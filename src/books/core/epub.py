@@ -0,0 +1,157 @@
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ElementTree
+
+# XML namespaces used in EPUB container and package documents
+containerNamespace = '{urn:oasis:names:tc:opendocument:xmlns:container}'
+opfNamespace = '{http://www.idpf.org/2007/opf}'
+dcNamespace = '{http://purl.org/dc/elements/1.1/}'
+
+
+def readEpubMetadata(path: str) -> dict[str, str]:
+    """
+    Read the metadata of an EPUB file from its package document, without running ebook-meta.
+
+    The values are returned under the names and in the form ebook-meta prints them, e.g. a series
+    as "Dune #1", so they can be parsed the same way.
+
+    :param path: The path to the EPUB file.
+    :type path: str
+    :return: The title, authors, published date, series, and description found, by ebook-meta
+        field name.
+    :rtype: dict[str, str]
+    :raises ValueError: If the EPUB file has no package document.
+    """
+    with zipfile.ZipFile(path) as epub:
+        container = ElementTree.fromstring(epub.read('META-INF/container.xml'))
+        rootfile = container.find(f'.//{containerNamespace}rootfile')
+        if rootfile is None or not rootfile.get('full-path'):
+            raise ValueError(f"No package document in {path}")
+        package = ElementTree.fromstring(epub.read(posixpath.normpath(rootfile.get('full-path'))))
+
+    metadata = package.find(f'{opfNamespace}metadata')
+    if metadata is None:
+        return {}
+
+    values = {}
+
+    title = _text(metadata.find(f'{dcNamespace}title'))
+    if title:
+        values['Title'] = title
+
+    # Creators without a role, or with the author role; other creators are editors, illustrators,
+    # and so on
+    roles = _refinedRoles(metadata)
+    authors = [
+        _text(creator)
+        for creator in metadata.iter(f'{dcNamespace}creator')
+        if _role(creator, roles) == 'aut' and _text(creator)
+    ]
+    if authors:
+        values['Author(s)'] = ' & '.join(authors)
+
+    published = _text(metadata.find(f'{dcNamespace}date'))
+    if published:
+        values['Published'] = published
+
+    series = _series(metadata)
+    if series:
+        values['Series'] = series
+
+    description = _text(metadata.find(f'{dcNamespace}description'))
+    if description:
+        values['Comments'] = description
+
+    return values
+
+
+def _text(element) -> str:
+    """
+    Get the stripped text of an element.
+
+    :param element: The element, or None.
+    :type element: Element | None
+    :return: The text of the element, or an empty string.
+    :rtype: str
+    """
+    if element is None or not element.text:
+        return ''
+    return element.text.strip()
+
+
+def _refinedRoles(metadata) -> dict[str, str]:
+    """
+    Get the roles EPUB 3 gives to elements in metas refining them.
+
+    :param metadata: The metadata element of the package document.
+    :type metadata: Element
+    :return: The role of each refined element, by element ID.
+    :rtype: dict[str, str]
+    """
+    roles = {}
+    for meta in metadata.iter(f'{opfNamespace}meta'):
+        refines = meta.get('refines', '')
+        if meta.get('property') == 'role' and refines.startswith('#'):
+            roles[refines[1:]] = _text(meta)
+    return roles
+
+
+def _role(creator, roles: dict[str, str]) -> str:
+    """
+    Get the role of a creator, from its EPUB 2 role attribute or an EPUB 3 refining meta.
+
+    :param creator: The creator element.
+    :type creator: Element
+    :param roles: The roles given in refining metas, by element ID.
+    :type roles: dict[str, str]
+    :return: The role of the creator; the author role if none is given.
+    :rtype: str
+    """
+    role = creator.get(f'{opfNamespace}role')
+    if role is None:
+        role = roles.get(creator.get('id'))
+    return role or 'aut'
+
+
+def _series(metadata) -> str:
+    """
+    Get the series of a book from calibre's series metadata, or EPUB 3 collection metadata.
+
+    :param metadata: The metadata element of the package document.
+    :type metadata: Element
+    :return: The series and number, e.g. "Dune #1", or an empty string.
+    :rtype: str
+    """
+    name = None
+    index = None
+    collectionId = None
+
+    for meta in metadata.iter(f'{opfNamespace}meta'):
+        metaName = meta.get('name')
+        if metaName == 'calibre:series':
+            name = meta.get('content')
+        elif metaName == 'calibre:series_index':
+            index = meta.get('content')
+        elif meta.get('property') == 'belongs-to-collection' and not name:
+            name = _text(meta)
+            collectionId = meta.get('id')
+
+    # EPUB 3 collections give their position in a meta refining the collection
+    if collectionId and index is None:
+        for meta in metadata.iter(f'{opfNamespace}meta'):
+            if meta.get('refines') == f'#{collectionId}' and meta.get('property') == 'group-position':
+                index = _text(meta)
+
+    if not name:
+        return ''
+
+    # calibre stores the number as a float, but prints whole numbers without a fraction
+    number = index or '1'
+    try:
+        value = float(number)
+        if value.is_integer():
+            number = str(int(value))
+    except ValueError:
+        pass
+
+    return f"{name.strip()} #{number}"
@@ -1,10 +1,37 @@
-from PySide6.QtGui import QFont
+from functools import lru_cache
+
+from PySide6.QtGui import QFont, QFontDatabase
+
+
+@lru_cache(maxsize=1)
+def _availableFamilies() -> frozenset[str]:
+    """
+    Get the families of the installed fonts, queried once.
+
+    :return: The installed font families.
+    :rtype: frozenset[str]
+    """
+    return frozenset(QFontDatabase.families())
 
 
 def getMonospacedFont() -> QFont:
     """
     Get a preferred monospaced font, depending on the platform.
 
+    The font is probed once and a copy is returned on every call, so callers may modify it.
+
+    :return: The preferred monospaced font.
+    :rtype: QFont
+    """
+    return QFont(_findMonospacedFont())
+
+
+# The installed fonts don't change while the application runs, so each font is probed once
+@lru_cache(maxsize=1)
+def _findMonospacedFont() -> QFont:
+    """
+    Probe the preferred monospaced fonts and return the first one available.
+
     :return: The preferred monospaced font.
     :rtype: QFont
     """
@@ -21,9 +48,10 @@ def getMonospacedFont() -> QFont:
         "monospace",
     ]
 
+    available = _availableFamilies()
     for fontName in preferredFonts:
-        font = QFont(fontName, 10)
-        if font.family():
+        if fontName in available:
+            font = QFont(fontName, 10)
             font.setStyleHint(QFont.StyleHint.Monospace)
             return font
 
@@ -37,6 +65,21 @@ def getSansSerifFont() -> QFont:
     """
     Get a preferred proportional font, depending on the platform.
 
+    The font is probed once and a copy is returned on every call, so callers may modify it.
+
+    Returns
+    -------
+    QFont
+        The preferred proportional font.
+    """
+    return QFont(_findSansSerifFont())
+
+
+@lru_cache(maxsize=1)
+def _findSansSerifFont() -> QFont:
+    """
+    Probe the preferred proportional fonts and return the first one available.
+
     Returns
     -------
     QFont
@@ -59,9 +102,10 @@ def getSansSerifFont() -> QFont:
         "Tahoma"
     ]
 
+    available = _availableFamilies()
     for fontName in preferredFonts:
-        font = QFont(fontName, 10)
-        if font.family():
+        if fontName in available:
+            font = QFont(fontName, 10)
             font.setStyleHint(QFont.StyleHint.SansSerif)
             return font
 
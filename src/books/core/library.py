@@ -1,8 +1,8 @@
-import json
 import os.path
 import shutil
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from PySide6.QtCore import Signal, QObject
@@ -11,15 +11,29 @@ from src.books.core.config import Config
 from src.books.core.log import Log
 from src.books.core.models.book import Book
 from src.books.core.models.job import Job
+from src.books.core.utils import iterJsonArray, writeJson, appendJsonLine, readJsonLines
+
+# The characters that are not allowed in file paths, as a translation table removing them from
+# strings, and as bytes for removing them from ASCII-only strings
+invalidPathChars = str.maketrans('', '', '<>:"/\\|?*')
+invalidPathBytes = b'<>:"/\\|?*'
+
+# The journal is folded into books.json once it holds more entries than this, or than a quarter of
+# the books in the library, whichever is more
+journalCompactionMinimum = 100
 
 
 class Library(QObject):
     """
     Represents the library of books, managing adding, removing, and updating books.
 
-    :signal bookRemoved: Emitted when a book is removed from the library.
+    Changes are appended to a journal rather than rewriting the whole books.json after every
+    change. The journal is replayed on load, and folded back into books.json once it grows large,
+    or by compact.
+
+    :signal booksRemoved: Emitted with the removed books when books are removed from the library.
     """
-    bookRemoved = Signal(Book)
+    booksRemoved = Signal(list)
 
     def __init__(self):
         """
@@ -27,64 +41,152 @@ class Library(QObject):
         """
         super().__init__()
 
-        config = Config.load()
-        self.rootPath = config.libraryPath
+        self.config = Config.load()
+        self.rootPath = self.config.libraryPath
         self.jsonPath = os.path.join(self.rootPath, 'books.json')
+        self.journalPath = os.path.join(self.rootPath, 'books.jsonl')
 
         self.books = []
+        self.booksById = {}
         self.numBooks = 0
+        self.journalEntries = 0
+
+        # Directories created or found by this library, to skip checking for them again
+        self.knownDirectories = set()
 
         self.load()
 
     def load(self):
         """
-        Load the books from the JSON file into the library.
+        Load the books from the JSON file into the library, then replay the journal.
         """
         if os.path.exists(self.jsonPath):
-            with open(self.jsonPath, 'r') as file:
-                data = json.load(file)
-                self.books = [Book(**item) for item in data]
+            self.books = [Book(**item) for item in iterJsonArray(self.jsonPath)]
         else:
             self.books = []
 
+        self.booksById = {book.id: book for book in self.books}
+
+        self.journalEntries = 0
+        if os.path.exists(self.journalPath):
+            self._replayJournal(readJsonLines(self.journalPath))
+
         self.numBooks = len(self.books)
         Log.info(f"Loaded {self.numBooks} books from {self.jsonPath}")
 
     def save(self):
         """
-        Save the current list of books to the JSON file.
+        Save the current list of books to the JSON file and clear the journal.
         """
-        configDir = os.path.dirname(self.jsonPath)
-        if not os.path.exists(configDir):
-            os.makedirs(configDir)
+        self._makeDirectory(os.path.dirname(self.jsonPath))
 
-        with open(self.jsonPath, 'w') as file:
-            json.dump([asdict(book) for book in self.books], file, indent=4)
+        writeJson(self.jsonPath, [book.toDict() for book in self.books])
+
+        # Every journaled change is now part of the JSON file
+        if os.path.exists(self.journalPath):
+            os.remove(self.journalPath)
+        self.journalEntries = 0
 
         Log.info(f"Saved {self.numBooks} books to {self.jsonPath}")
 
+    def _makeDirectory(self, path: str):
+        """
+        Create a directory and its parents, unless the directory is already known to exist.
+
+        :param path: The path of the directory.
+        :type path: str
+        """
+        if path not in self.knownDirectories:
+            os.makedirs(path, exist_ok=True)
+            self.knownDirectories.add(path)
+
+    def _removeEmptyDirectory(self, path: str):
+        """
+        Remove a directory if it exists and is empty.
+
+        :param path: The path of the directory.
+        :type path: str
+        """
+        # rmdir only removes empty directories, so there is no need to check first
+        try:
+            os.rmdir(path)
+        except OSError:
+            return
+        self.knownDirectories.discard(path)
+
+    def compact(self):
+        """
+        Fold the journal into the JSON file, if any changes have been journaled since the last save.
+        """
+        if self.journalEntries:
+            self.save()
+
+    def _appendJournal(self, op: str, book: Book):
+        """
+        Append a change to the journal.
+
+        :param op: The change, one of "add", "update", or "remove".
+        :type op: str
+        :param book: The book that was changed.
+        :type book: Book
+        """
+        if op == "remove":
+            entry = {"op": op, "id": book.id}
+        else:
+            entry = {"op": op, "book": book.toDict()}
+
+        self._makeDirectory(os.path.dirname(self.journalPath))
+
+        appendJsonLine(self.journalPath, entry)
+        self.journalEntries += 1
+
+        # Keep the journal small relative to books.json, so replaying it on load stays cheap
+        if self.journalEntries > max(journalCompactionMinimum, self.numBooks // 4):
+            self.save()
+
+    def _replayJournal(self, entries: list[dict]):
+        """
+        Apply journaled changes to the books loaded from the JSON file.
+
+        The changes are applied to the index alone, which keeps the books in order: an updated book
+        keeps its place, and an added book goes last. The list of books is rebuilt from it once.
+
+        :param entries: The journal entries, oldest first.
+        :type entries: list[dict]
+        """
+        for entry in entries:
+            op = entry.get("op")
+            if op == "remove":
+                self.booksById.pop(entry["id"], None)
+            elif op in ("add", "update"):
+                book = Book(**entry["book"])
+                self.booksById[book.id] = book
+            else:
+                continue
+            self.journalEntries += 1
+
+        self.books = list(self.booksById.values())
+
     @staticmethod
+    @lru_cache(maxsize=8192)
     def sanitizeForPath(name: str) -> str:
         """
         Sanitize a string to make it safe for use in a file path.
 
+        Results are cached, since the same authors and series recur across many books.
+
         :param name: The string to sanitize.
         :type name: str
         :return: The sanitized string.
         :rtype: Optional[str]
         """
-        invalidChars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        sanitized = name
-        for invalidChar in invalidChars:
-            sanitized = sanitized.replace(invalidChar, '')
-
-        if len(sanitized) > 64:
-            sanitized = sanitized[:64]
-
-        sanitized = sanitized.strip('.')
-        sanitized = sanitized.strip()
+        # Most names are ASCII, and bytes.translate removes characters much faster than str.translate
+        if name.isascii():
+            sanitized = name.encode('ascii').translate(None, invalidPathBytes).decode('ascii')
+        else:
+            sanitized = name.translate(invalidPathChars)
 
-        return sanitized
+        return sanitized[:64].strip('.').strip()
 
     def bookDirectory(self, book: Book) -> str:
         """
@@ -95,6 +197,19 @@ class Library(QObject):
         :return: The directory path for the book.
         :rtype: str
         """
+        author, title, _series = self._sanitizedParts(book)
+        return os.path.join(self.rootPath, author, title)
+
+    def _sanitizedParts(self, book: Book) -> tuple[str, str, str | None]:
+        """
+        Get a book's author, title, and series, sanitized for use in a file path.
+
+        :param book: The book object.
+        :type book: Book
+        :return: The sanitized author, title, and series, or None for the series if the book is not
+            part of one.
+        :rtype: tuple[str, str, str | None]
+        """
         author = self.sanitizeForPath(book.author)
         if not author:
             author = "Unknown Author"
@@ -103,7 +218,13 @@ class Library(QObject):
         if not title:
             title = "Unknown Title"
 
-        return os.path.join(self.rootPath, author, title)
+        series = None
+        if book.series:
+            series = self.sanitizeForPath(book.series)
+            if not series:
+                series = "Unknown Series"
+
+        return author, title, series
 
     def bookFile(self, book: Book) -> str:
         """
@@ -115,21 +236,12 @@ class Library(QObject):
         :rtype: str
         """
         extension = os.path.splitext(book.path)[1].lower()
-        bookDirectory = self.bookDirectory(book)
 
-        author = self.sanitizeForPath(book.author)
-        if not author:
-            author = "Unknown Author"
-
-        title = self.sanitizeForPath(book.title)
-        if not title:
-            title = "Unknown Title"
-
-        if book.series:
-            series = self.sanitizeForPath(book.series)
-            if not series:
-                series = "Unknown Series"
+        # Sanitize the author and title once, for both the directory and the file name
+        author, title, series = self._sanitizedParts(book)
+        bookDirectory = os.path.join(self.rootPath, author, title)
 
+        if series:
             if book.seriesNumber:
                 seriesNumber = book.seriesNumber
                 if not seriesNumber:
@@ -144,7 +256,7 @@ class Library(QObject):
 
         return os.path.join(bookDirectory, f"{author} - {title}{extension}")
 
-    def addBook(self, filePath: str, job: Job = None) -> Book:
+    def addBook(self, filePath: str, job: Job = None, move: bool = False) -> Book:
         """
         Add a new book to the library from a file path.
 
@@ -152,19 +264,65 @@ class Library(QObject):
         :type filePath: str
         :param job: The job associated with the book download.
         :type job: Job | None
+        :param move: Whether to move the book file into the library rather than copy it.
+        :type move: bool
         :return: The added book object.
         :rtype: Book
         """
-        Log.info(f"Adding book from {filePath}")
+        return self.commitBook(self.prepareBook(filePath, job, move))
 
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def addBooks(self, filePaths: list[str]):
+        """
+        Add several new books to the library from file paths.
+
+        The books are prepared in parallel, since reading their metadata runs an external tool and
+        copying them is I/O-bound. The prepared books are then added to the library on the calling
+        thread, in the order of the file paths.
+
+        :param filePaths: The file paths to the book files.
+        :type filePaths: list[str]
+        :return: The file path and the added book object, or None if the book could not be added,
+            for each file path, in order.
+        :rtype: Iterator[tuple[str, Book | None]]
+        """
+        # The books in a batch are added at the same time
+        added = datetime.now().isoformat(sep=' ', timespec='seconds')
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [
+                (filePath, executor.submit(self.prepareBook, filePath, added=added)) for filePath in filePaths
+            ]
+            # Later books keep being prepared while an earlier one is awaited and added
+            for filePath, future in futures:
+                try:
+                    book = self.commitBook(future.result())
+                except Exception as e:
+                    Log.info(f"Error adding {filePath}: {e}")
+                    book = None
+                yield filePath, book
+
+    def readBook(self, filePath: str, job: Job = None, added: str = None) -> Book:
+        """
+        Create a book from a file, reading its metadata from the file, the job, or the file name.
+
+        :param filePath: The file path to the book file.
+        :type filePath: str
+        :param job: The job associated with the book download.
+        :type job: Job | None
+        :param added: The date the book was added; the current time if not given.
+        :type added: str | None
+        :return: The book object, not yet added to the library.
+        :rtype: Book
+        """
+        if added is None:
+            added = datetime.now().isoformat(sep=' ', timespec='seconds')
 
         # Initialize the Book object with default metadata
-        book = Book("Unknown Author", None, None, "Unknown Title", None, None, None, now, filePath)
+        book = Book("Unknown Author", None, None, "Unknown Title", None, None, None, added, filePath)
 
         try:
             # Attempt to load metadata from the book file
-            book.loadMetadata()
+            book.loadMetadata(self.config)
         except Exception as e:
             print("Failed to extract metadata:", e)
             if job:
@@ -184,26 +342,61 @@ class Library(QObject):
                     filenameWithoutExtension = os.path.splitext(filename)[0]
                     book.title = filenameWithoutExtension
 
-        # Create the directory for the book
-        bookDirectory = self.bookDirectory(book)
-        if not os.path.exists(bookDirectory):
-            os.makedirs(bookDirectory)
+        return book
+
+    def prepareBook(self, filePath: str, job: Job = None, move: bool = False, added: str = None) -> Book:
+        """
+        Read a book's metadata and copy the book file into the library, without adding the book
+        to the library. This may run on any thread.
 
-        # Copy the book file to the library
+        :param filePath: The file path to the book file.
+        :type filePath: str
+        :param job: The job associated with the book download.
+        :type job: Job | None
+        :param move: Whether to move the book file into the library rather than copy it.
+        :type move: bool
+        :param added: The date the book was added; the current time if not given.
+        :type added: str | None
+        :return: The book object, ready to be added with commitBook.
+        :rtype: Book
+        """
+        Log.info(f"Adding book from {filePath}")
+        book = self.readBook(filePath, job, added)
+
+        # Create the directory for the book
         bookFile = self.bookFile(book)
-        shutil.copy(filePath, bookFile)
+        bookDirectory = os.path.dirname(bookFile)
+        self._makeDirectory(bookDirectory)
+
+        # Copy the book file to the library, or move it if it is not needed elsewhere; on the same
+        # filesystem, moving is a rename and no data is copied
+        if move:
+            shutil.move(filePath, bookFile)
+        else:
+            shutil.copyfile(filePath, bookFile)
         book.path = bookFile
 
         # Truncate author name if it's too long
         if len(book.author) > 64:
             book.author = book.author[:64]
 
-        # Add the book to the library
+        return book
+
+    def commitBook(self, book: Book) -> Book:
+        """
+        Add a book prepared by prepareBook to the library.
+
+        :param book: The prepared book object.
+        :type book: Book
+        :return: The added book object.
+        :rtype: Book
+        """
         self.books.append(book)
-        self.save()
+        self.booksById[book.id] = book
         self.numBooks = len(self.books)
+        self._appendJournal("add", book)
 
-        Log.info(f"Added book: {asdict(book)}")
+        Log.info(f"Added book: {book.toDict()}")
         return book
 
     def updateBook(self, book: Book):
@@ -214,11 +407,10 @@ class Library(QObject):
         :type book: Book
         """
         # Save updated metadata to the book file
-        book.saveMetadata()
+        book.saveMetadata(self.config)
 
         # Find the book in the library
-        index = next((i for i, b in enumerate(self.books) if b.id == book.id), None)
-        oldBook = self.books[index]
+        oldBook = self.getBookById(book.id)
 
         oldPath = oldBook.path
         newPath = self.bookFile(book)
@@ -229,21 +421,20 @@ class Library(QObject):
             oldAuthorDir = os.path.dirname(oldBookDir)
 
             newDir = os.path.dirname(newPath)
-            if not os.path.exists(newDir):
-                os.makedirs(newDir)
+            self._makeDirectory(newDir)
 
             os.rename(oldPath, newPath)
             book.path = newPath
 
             # Remove old directories if they are empty
-            if not os.listdir(oldBookDir):
-                os.rmdir(oldBookDir)
-            if not os.listdir(oldAuthorDir):
-                os.rmdir(oldAuthorDir)
+            self._removeEmptyDirectory(oldBookDir)
+            self._removeEmptyDirectory(oldAuthorDir)
 
-        # Update the book in the library
-        self.books[index] = book
-        self.save()
+        # Update the book in the library; usually the edited book is the library's own object
+        if oldBook is not book:
+            self.books[self.books.index(oldBook)] = book
+            self.booksById[book.id] = book
+        self._appendJournal("update", book)
 
     def removeBook(self, book: Book):
         """
@@ -252,35 +443,44 @@ class Library(QObject):
         :param book: The book object to remove.
         :type book: Book
         """
-        # Find the book in the library
-        index = next((i for i, b in enumerate(self.books) if b.id == book.id), None)
-        if index is None:
-            raise ValueError(f"Book with ID {book.id} not found")
+        self.removeBooks([book.id])
 
-        # Remove the book from the list
-        book = self.books.pop(index)
+    def removeBooks(self, bookIds: list[str]):
+        """
+        Remove several books from the library, delete their files, and save the library once.
 
-        # Delete the book file
-        try:
-            os.remove(book.path)
-        except FileNotFoundError:
-            Log.info(f"Error deleting {book.path}. The file does not exist.")
+        :param bookIds: The unique identifiers of the books to remove.
+        :type bookIds: list[str]
+        :raises ValueError: If any of the books is not found.
+        """
+        ids = set(bookIds)
 
-        # Remove empty directories
-        bookDir = os.path.dirname(book.path)
-        # if the directory doesn't exist, don't try to remove it
-        if os.path.exists(bookDir) and not os.listdir(bookDir):
-            os.rmdir(bookDir)
+        # Find the books in the library
+        removed = self.getBooksByIds(ids)
 
-        authorDir = os.path.dirname(bookDir)
-        if os.path.exists(authorDir) and not os.listdir(authorDir):
-            os.rmdir(authorDir)
+        # Remove the books from the list
+        self.books = [book for book in self.books if book.id not in ids]
+        for bookId in ids:
+            del self.booksById[bookId]
+
+        for book in removed:
+            # Delete the book file
+            try:
+                os.remove(book.path)
+            except FileNotFoundError:
+                Log.info(f"Error deleting {book.path}. The file does not exist.")
+
+            # Remove empty directories
+            bookDir = os.path.dirname(book.path)
+            self._removeEmptyDirectory(bookDir)
+            self._removeEmptyDirectory(os.path.dirname(bookDir))
 
-        self.save()
         self.numBooks = len(self.books)
+        for book in removed:
+            self._appendJournal("remove", book)
 
-        # Emit signal that the book was removed
-        self.bookRemoved.emit(book)
+        # Emit signal that the books were removed
+        self.booksRemoved.emit(removed)
 
     def getBookById(self, bookId: str) -> Book:
         """
@@ -292,10 +492,26 @@ class Library(QObject):
         :rtype: Book
         :raises ValueError: If the book is not found.
         """
-        index = next((i for i, b in enumerate(self.books) if b.id == bookId), None)
-        if index is not None:
-            return self.books[index]
-        raise ValueError(f"Book with ID {bookId} not found")
+        try:
+            return self.booksById[bookId]
+        except KeyError:
+            raise ValueError(f"Book with ID {bookId} not found") from None
+
+    def getBooksByIds(self, bookIds) -> list[Book]:
+        """
+        Retrieve several books from the library by their IDs.
+
+        :param bookIds: The unique identifiers of the books.
+        :type bookIds: Iterable[str]
+        :return: The book objects, in the order of the IDs.
+        :rtype: list[Book]
+        :raises ValueError: If any of the books is not found.
+        """
+        booksById = self.booksById
+        try:
+            return [booksById[bookId] for bookId in bookIds]
+        except KeyError as e:
+            raise ValueError(f"Book with ID {e.args[0]} not found") from None
 
     def authorPath(self, authorName: str) -> str:
         """
@@ -326,8 +542,10 @@ class Library(QObject):
         Reset the library by deleting all books and directories.
         """
         shutil.rmtree(self.rootPath)
-        os.makedirs(self.rootPath)
+        os.makedirs(self.rootPath, exist_ok=True)
+        self.knownDirectories.clear()
         self.books = []
+        self.booksById = {}
         self.numBooks = 0
         self.save()
         self.load()
@@ -1,10 +1,30 @@
 import logging
 import os
+import threading
+import time
 from sys import platform
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal, QStandardPaths
 from datetime import datetime
 
+# The ISO 8601 format of log timestamps, with microseconds
+isoDateFormat = "%Y-%m-%dT%H:%M:%S.%f"
+
+# The second last formatted by isoTimestamp, and its text
+_timestampSecond = (None, "")
+
+
+def isoTimestamp(created: float) -> str:
+    """Format a record's creation time as an ISO 8601 timestamp with microseconds. The date and time
+    are formatted once per second, since log records come in bursts."""
+    global _timestampSecond
+    second = int(created)
+    cachedSecond, text = _timestampSecond
+    if second != cachedSecond:
+        text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _timestampSecond = (second, text)
+    return f"{text}.{int((created - second) * 1_000_000):06d}"
+
 
 class LogSignalEmitter(QObject):
     messageLogged = Signal(dict)
@@ -19,10 +39,55 @@ class SourceFilter(logging.Filter):
         return True
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that buffers records in memory, writing them to disk in large blocks rather than
+    flushing after every record. Records at or above flushLevel are written immediately, and any
+    other record at most flushInterval seconds after it was logged."""
+
+    bufferSize = 65536
+    flushInterval = 1.0
+
+    def __init__(self, filename: str, flushLevel: int = logging.WARNING, encoding: str = None):
+        self.flushLevel = flushLevel
+        self.flushTimer = None
+        super().__init__(filename, encoding=encoding)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.flushTimer is not None:
+                self.flushTimer.cancel()
+                self.flushTimer = None
+            super().flush()
+        finally:
+            self.release()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.bufferSize, encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flushLevel:
+                self.flush()
+            elif self.flushTimer is None:
+                # Flush from a timer, so the last records before a quiet spell still reach the disk
+                self.flushTimer = threading.Timer(self.flushInterval, self.flush)
+                self.flushTimer.daemon = True
+                self.flushTimer.start()
+        except Exception:
+            self.handleError(record)
+
+
 class CustomFormatter(logging.Formatter):
     """Custom formatter to support ISO 8601 timestamps with microseconds and include a 'source'."""
 
     def formatTime(self, record, datefmt=None):
+        if datefmt == isoDateFormat:
+            return isoTimestamp(record.created)
+
         # Use datetime.fromtimestamp to get the full timestamp with microseconds
         ct = datetime.fromtimestamp(record.created)
         if datefmt:
@@ -38,6 +103,7 @@ class Log:
     _instance = None
     _logger = None
     _logFilePath = None
+    _fileHandler = None
     _signalEmitter = None
 
     def __new__(cls):
@@ -63,12 +129,14 @@ class Log:
         cls._logger = logging.getLogger("BooksLogger")
         cls._logger.setLevel(logging.DEBUG)
 
-        # Use ISO 8601-compliant timestamp format with 'source' field
-        fileHandler = logging.FileHandler(str(cls._logFilePath), encoding="utf-8")
+        # Use ISO 8601-compliant timestamp format with 'source' field; records are buffered, and
+        # written when the buffer fills, within a second, on warnings and errors, when the log file
+        # is read, and at exit
+        fileHandler = BufferedFileHandler(str(cls._logFilePath), encoding="utf-8")
         fileHandler.setLevel(logging.DEBUG)
         fileFormatter = CustomFormatter(
             "%(asctime)s - %(source)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%S.%f"  # ISO 8601 format
+            datefmt=isoDateFormat
         )
         fileHandler.setFormatter(fileFormatter)
 
@@ -77,6 +145,7 @@ class Log:
         fileHandler.addFilter(source_filter)
 
         cls._logger.addHandler(fileHandler)
+        cls._fileHandler = fileHandler
 
         # Signal emitter and handler
         cls._signalEmitter = LogSignalEmitter()
@@ -114,6 +183,8 @@ class Log:
     @classmethod
     def getLogFilePath(cls) -> Path:
         cls._setup()
+        # Write any buffered records, so the file is complete for whoever reads it
+        cls._fileHandler.flush()
         return cls._logFilePath
 
     @classmethod
@@ -129,7 +200,7 @@ class LogSignalHandler(logging.Handler):
 
     def emit(self, record: logging.LogRecord):
         entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": isoTimestamp(record.created),
             "source": getattr(record, "source", "unknown").upper(),
             "level": record.levelname.upper(),
             "message": record.getMessage()
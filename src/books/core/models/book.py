@@ -1,4 +1,5 @@
 import os
+import re
 import subprocess
 import uuid
 from dataclasses import dataclass, field
@@ -7,11 +8,85 @@ from datetime import datetime
 from dateutil import parser
 
 from src.books.core.config import Config
+from src.books.core.epub import readEpubMetadata
 from src.books.core.log import Log
 from src.books.core.utils import run, cleanText
 
+# The number of seconds after which ebook-meta is assumed to be stuck on a book
+metadataTimeout = 60
 
-@dataclass
+# The ebook-meta output lines read by Book.loadMetadata, e.g. "Title               : Dune"
+metadataPattern = re.compile(r'^(Title|Author\(s\)|Published|Series|Comments)[ \t]*:(.*)$', re.MULTILINE)
+
+# A date with only a year, or a year and month, e.g. "1965" or "2010-05"
+partialDatePattern = re.compile(r'^\d{4}(-\d{2})?$')
+
+
+def _parseAuthors(value: str) -> str:
+    """
+    Parse the authors of a book as printed by ebook-meta.
+
+    :param value: The authors, e.g. "Frank Herbert [Herbert, Frank]".
+    :type value: str
+    :return: The authors, without their sort names.
+    :rtype: str
+    """
+    # Drop the author sort names, e.g. "Frank Herbert [Herbert, Frank]"
+    if '[' in value:
+        value = value.split('[')[0].strip()
+    return value
+
+
+def _parsePublished(value: str) -> str:
+    """
+    Parse the publication date of a book.
+
+    :param value: The date, e.g. "2010-05-04T22:00:00+00:00", "4 May 2010", or "1965".
+    :type value: str
+    :return: The date as YYYY-MM-DD, or as YYYY or YYYY-MM if only those were given, or the
+        value itself if it is not a date.
+    :rtype: str
+    """
+    # Partial dates are kept as given; parsing them would fill in the current month and day
+    if partialDatePattern.match(value):
+        return value
+    # ebook-meta prints ISO 8601 dates, e.g. "2010-05-04T22:00:00+00:00", which don't need dateutil
+    try:
+        return datetime.fromisoformat(value).strftime('%Y-%m-%d')
+    except ValueError:
+        pass
+    try:
+        return parser.parse(value, default=datetime(1, 1, 1)).strftime('%Y-%m-%d')
+    except ValueError:
+        return value
+
+
+def _parseSeries(value: str) -> tuple[str, str] | None:
+    """
+    Parse the series of a book as printed by ebook-meta.
+
+    :param value: The series and number, e.g. "Dune #1".
+    :type value: str
+    :return: The series name and number, or None if the series has no number.
+    :rtype: tuple[str, str] | None
+    """
+    # Only series with a number, e.g. "Dune #1", are used
+    if '#' not in value:
+        return None
+    seriesName, seriesNumber = value.rsplit('#', 1)
+    return seriesName.strip(), seriesNumber.strip()
+
+
+metadataParsers = {
+    'Title': str,
+    'Author(s)': _parseAuthors,
+    'Published': _parsePublished,
+    'Series': _parseSeries,
+    'Comments': cleanText,
+}
+
+
+@dataclass(slots=True, eq=False)
 class Book:
     """
     Represents a book in the library with metadata and file information.
@@ -28,114 +103,66 @@ class Book:
     format: str = ""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
 
-    def __init__(self, author: str, series: str | None, seriesNumber: int | None, title: str,
-                 published: str | None, type: str | None, description: str | None, added: str,
-                 path: str, format: str = None, id: str = None):
-        """
-        Initialize a Book object with metadata and file path.
-
-        :param author: The author of the book.
-        :type author: str
-        :param series: The series name, if any.
-        :type series: str | None
-        :param seriesNumber: The number in the series, if any.
-        :type seriesNumber: int | None
-        :param title: The title of the book.
-        :type title: str
-        :param published: The published date, if any.
-        :type published: str | None
-        :param type: The type of the book.
-        :type type: str | None
-        :param description: The description of the book.
-        :type description: str | None
-        :param added: The date the book was added.
-        :type added: str
-        :param path: The file path to the book.
-        :type path: str
-        :param format: The file format of the book.
-        :type format: str | None
-        :param id: The unique identifier for the book.
-        :type id: str | None
-        """
-        self.author = author
-        self.series = series
-        self.seriesNumber = seriesNumber
-        self.title = title
-        self.published = published
-        self.type = type
-        self.description = description
-
-        if format:
-            self.format = format
-        else:
-            # Extract format from file extension
-            extension = os.path.splitext(path)[1].lower()
-            self.format = extension.strip('.').upper()
-
-        self.added = added
-        self.path = path
-
-        if id:
-            self.id = id
-        else:
+    def __post_init__(self):
+        """
+        Fill in the format from the file extension and generate an ID, if they were not given.
+        """
+        if not self.format:
+            # Extract format from file extension, without its leading dot
+            self.format = os.path.splitext(self.path)[1][1:].upper()
+
+        if not self.id:
             self.id = str(uuid.uuid4())
 
-    def loadMetadata(self):
+    def toDict(self) -> dict:
         """
-        Load metadata for the book using an external metadata extraction tool.
+        Get the fields of the book as a dictionary, as written to books.json.
+
+        :return: The book's fields, by name.
+        :rtype: dict
         """
-        config = Config.load()
-        args = []
+        return {
+            'author': self.author,
+            'series': self.series,
+            'seriesNumber': self.seriesNumber,
+            'title': self.title,
+            'published': self.published,
+            'type': self.type,
+            'description': self.description,
+            'added': self.added,
+            'path': self.path,
+            'format': self.format,
+            'id': self.id,
+        }
 
-        if config.pythonPath:
-            args.append(config.pythonPath)
-        args.append(config.ebookMetaPath)
-        args.append(self.path)
+    def loadMetadata(self, config: Config = None):
+        """
+        Load metadata for the book. EPUB files are read directly; other formats, and EPUB files
+        that can't be read, use an external metadata extraction tool.
 
-        Log.info(f"Getting metadata: {args}")
+        :param config: The configuration to use; loaded if not given.
+        :type config: Config | None
+        """
+        values = None
+        if self.path.lower().endswith('.epub'):
+            try:
+                values = readEpubMetadata(self.path)
+            except Exception as e:
+                Log.info(f"Failed to read EPUB metadata from {self.path}: {e}")
 
-        # Run the external metadata extraction tool
-        try:
-            result = run(args)
-        except subprocess.CalledProcessError as e:
-            Log.info(f"Failed to get metadata: {e.stderr}")
-            return None, None
+        if values is None:
+            values = self._runEbookMeta(config)
+            if values is None:
+                return None, None
 
-        output = result.stdout
-        Log.info(f"Metadata:\n{output}")
-        lines = output.split('\n')
-
-        # Initialize metadata variables
-        title = None
-        authors = None
-        published = None
-        seriesName = None
-        seriesNumber = None
-        description = None
-
-        # Parse the output line by line
-        for line in lines:
-            if line.startswith('Title'):
-                title = line.split(':', 1)[1].strip()
-            elif line.startswith('Author(s)'):
-                authors = line.split(':', 1)[1].strip()
-                if '[' in authors:
-                    authors = authors.split('[')[0].strip()
-            elif line.startswith('Published'):
-                published = line.split(':', 1)[1].strip()
-                try:
-                    published = parser.parse(published).strftime('%Y-%m-%d')
-                except ValueError:
-                    pass
-            elif line.startswith('Series'):
-                series = line.split(':', 1)[1].strip()
-                if '#' in series:
-                    seriesName, seriesNumber = series.rsplit('#', 1)
-                    seriesName = seriesName.strip()
-                    seriesNumber = seriesNumber.strip()
-            elif line.startswith("Comments"):
-                description = line.split(':', 1)[1].strip()
-                description = cleanText(description)
+        # Parse the fields we use; each field is parsed by its handler
+        fields = {name: metadataParsers[name](value) for name, value in values.items()}
+
+        title = fields.get('Title')
+        authors = fields.get('Author(s)')
+        published = fields.get('Published')
+        seriesName, seriesNumber = fields.get('Series') or (None, None)
+        description = fields.get('Comments')
 
         # Update the Book object with the parsed metadata
         if authors:
@@ -150,11 +177,48 @@ class Book:
         if description:
             self.description = description
 
-    def saveMetadata(self):
+    def _runEbookMeta(self, config: Config = None) -> dict[str, str] | None:
+        """
+        Read the metadata fields of the book with ebook-meta.
+
+        :param config: The configuration to use; loaded if not given.
+        :type config: Config | None
+        :return: The unparsed values of the fields used, by field name, or None if ebook-meta failed.
+        :rtype: dict[str, str] | None
+        """
+        if config is None:
+            config = Config.load()
+        args = []
+
+        if config.pythonPath:
+            args.append(config.pythonPath)
+        args.append(config.ebookMetaPath)
+        args.append(self.path)
+
+        Log.info(f"Getting metadata: {args}")
+
+        # Run the external metadata extraction tool
+        try:
+            result = run(args, timeout=metadataTimeout)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            Log.info(f"Failed to get metadata: {e.stderr}")
+            return None
+
+        output = result.stdout
+        Log.info(f"Metadata:\n{output}")
+
+        # Later lines win
+        return {name: value.strip() for name, value in metadataPattern.findall(output)}
+
+    def saveMetadata(self, config: Config = None):
         """
         Save metadata for the book to the file using an external tool.
+
+        :param config: The configuration to use; loaded if not given.
+        :type config: Config | None
         """
-        config = Config.load()
+        if config is None:
+            config = Config.load()
         args = []
 
         if config.pythonPath:
@@ -173,22 +237,33 @@ class Book:
         Log.info(f"Updating metadata: {args}")
 
         try:
-            result = run(args)
-            Log.info(f"Metadata updated:\n{result.stdout}")
-        except subprocess.CalledProcessError as e:
+            run(args, capture=False, timeout=metadataTimeout)
+            Log.info(f"Metadata updated: {self.path}")
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             Log.info(f"Failed to update metadata: {e.stderr}")
 
 
     def __eq__(self, other):
         """
-        Check equality based on the book title.
+        Check equality based on the book ID.
 
-        :param other: The book object to compare.
-        :type other: Book
-        :return: True if titles match, False otherwise.
+        :param other: The object to compare.
+        :type other: object
+        :return: True if the other object is a book with the same ID, False otherwise.
         :rtype: bool
         """
-        return self.title == other.title
+        if not isinstance(other, Book):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self):
+        """
+        Hash the book by its ID, consistent with equality.
+
+        :return: The hash of the book's ID.
+        :rtype: int
+        """
+        return hash(self.id)
 
     def __lt__(self, other):
         """
@@ -202,12 +277,16 @@ class Book:
         return self.title < other.title
 
 
-def createBookFromFile(path: str):
+def createBookFromFile(path: str, config: Config = None, added: str = None):
     """
     Create a Book object from a file path by initializing it with default values and loading its metadata.
 
     :param path: The file path to create the book from.
     :type path: str
+    :param config: The configuration to use; loaded if not given.
+    :type config: Config | None
+    :param added: The date the book was added; the current time if not given.
+    :type added: str | None
     :return: A book object initialized from the file's metadata.
     :rtype: src.books.models.book.Book
     """
@@ -219,8 +298,8 @@ def createBookFromFile(path: str):
         None,
         None,
         None,
-        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        added or datetime.now().isoformat(sep=' ', timespec='seconds'),
         path
     )
-    book.loadMetadata()
+    book.loadMetadata(config)
     return book
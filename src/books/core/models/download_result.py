@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.books.core.models.job import Job
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadResult:
     """
     Represents the result of a download job.
@@ -2,7 +2,7 @@ import uuid
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """
     Represents a download job in the queue.
@@ -1,42 +1,165 @@
 import subprocess
 import platform
 import html
-import re
+import json
+import os
+from functools import lru_cache
 
 import nh3
 
 
-def run(args: list[str]) -> subprocess.CompletedProcess[str]:
+def _baseRunOptions() -> dict:
     """
-    Runs a subprocess with the specified arguments, always capturing stdout and stderr,
-    and using UTF-8 encoding for text. On Windows, the subprocess is run with a hidden window.
+    Build the subprocess options shared by every call to run.
 
-    :param args: The command to run and its arguments.
-    :type args: list[str]
-    :return: The result of the subprocess.
-    :rtype: subprocess.CompletedProcess[str]
+    :return: The keyword arguments for subprocess.run.
+    :rtype: dict
     """
-    kwargs = {
+    options = {
         'check': True,
         'text': True,
         'encoding': 'utf-8',
-        'stdout': subprocess.PIPE,
         'stderr': subprocess.PIPE
     }
 
+    # On Windows, run subprocesses with a hidden window
     if platform.system() == 'Windows':
         si = subprocess.STARTUPINFO()
         si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        kwargs['startupinfo'] = si
+        options['startupinfo'] = si
+
+    return options
 
-    return subprocess.run(args, **kwargs)
 
+# The platform doesn't change while the application runs, so the options are built once
+baseRunOptions = _baseRunOptions()
 
+
+def run(args: list[str], capture: bool = True, timeout: float | None = None) -> subprocess.CompletedProcess[str]:
+    """
+    Runs a subprocess with the specified arguments, capturing stderr and, unless disabled, stdout,
+    and using UTF-8 encoding for text. On Windows, the subprocess is run with a hidden window.
+
+    :param args: The command to run and its arguments.
+    :type args: list[str]
+    :param capture: Whether to capture stdout. If False, stdout is discarded.
+    :type capture: bool
+    :param timeout: The number of seconds after which the subprocess is killed, if any.
+    :type timeout: float | None
+    :return: The result of the subprocess.
+    :rtype: subprocess.CompletedProcess[str]
+    :raises subprocess.TimeoutExpired: If the subprocess runs longer than the timeout.
+    """
+    stdout = subprocess.PIPE if capture else subprocess.DEVNULL
+    return subprocess.run(args, stdout=stdout, timeout=timeout, **baseRunOptions)
+
+
+def readJson(path: str):
+    """
+    Read a JSON file.
+
+    :param path: The path to the JSON file.
+    :type path: str
+    :return: The decoded JSON data.
+    :rtype: Any
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def iterJsonArray(path: str):
+    """
+    Iterate over the items of a JSON file containing an array. The array is decoded at once, but
+    each item is released as soon as it has been consumed.
+
+    :param path: The path to the JSON file.
+    :type path: str
+    :return: The decoded items of the array.
+    :rtype: Iterator[Any]
+    """
+    # Pop the items, in order, so the decoded array shrinks while the caller builds objects from it
+    items = readJson(path)
+    items.reverse()
+    while items:
+        yield items.pop()
+
+
+def writeJson(path: str, data) -> None:
+    """
+    Write data to a JSON file, indented by four spaces. The data is encoded in memory and replaces
+    the file in a single write.
+
+    :param path: The path to the JSON file.
+    :type path: str
+    :param data: The data to encode.
+    :type data: Any
+    """
+    _replaceFile(path, json.dumps(data, indent=4).encode('utf-8'))
+
+
+def _replaceFile(path: str, content: bytes) -> None:
+    """
+    Replace the contents of a file by writing them to a temporary file and moving it into place,
+    so a partially written file is never left behind. The temporary file is synced to disk before
+    it is moved, so a crash can't leave the file empty either.
+
+    :param path: The path to the file.
+    :type path: str
+    :param content: The new contents of the file.
+    :type content: bytes
+    """
+    tempPath = f"{path}.tmp"
+    with open(tempPath, 'wb') as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tempPath, path)
+
+
+def appendJsonLine(path: str, data) -> None:
+    """
+    Append data to a JSON Lines file as a single line.
+
+    :param path: The path to the JSON Lines file.
+    :type path: str
+    :param data: The data to encode.
+    :type data: Any
+    """
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write(json.dumps(data) + '\n')
+
+
+def readJsonLines(path: str) -> list:
+    """
+    Read a JSON Lines file. A truncated last line, left by an interrupted write, is ignored.
+
+    :param path: The path to the JSON Lines file.
+    :type path: str
+    :return: The decoded data of each complete line.
+    :rtype: list
+    """
+    records = []
+    with open(path, 'rb') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # A truncated line is invalid JSON, or invalid UTF-8 if cut inside a character
+                break
+    return records
+
+
+@lru_cache(maxsize=128)
 def cleanText(text: str) -> str:
     """
     Clean the input text by unescaping HTML entities, normalizing fractions and temperatures,
     collapsing whitespace, and stripping leading and trailing spaces.
 
+    The most recent results are cached. The cache is kept small, since the text is usually a whole
+    book description and most descriptions are cleaned only once.
+
     Args:
         text (str): The input text to be cleaned.
 
@@ -45,12 +168,14 @@ def cleanText(text: str) -> str:
     """
     if text:
         text = stripHtml(text)
-        text = html.unescape(text)
+        if '&' in text:
+            text = html.unescape(text)
         text = collapseWhitespace(text)
         text = text.strip()
     return text
 
 
+@lru_cache(maxsize=128)
 def stripHtml(text: str) -> str:
     """
     Strip all HTML tags from the input text using nh3, allowing no tags.
@@ -61,6 +186,9 @@ def stripHtml(text: str) -> str:
     Returns:
         str: The text with HTML tags removed.
     """
+    # Text without a '<' has no tags to strip
+    if '<' not in text:
+        return text
     return nh3.clean(text, tags=set())
 
 
@@ -75,7 +203,12 @@ def collapseWhitespace(val: str) -> str:
     Returns:
         str: The text with collapsed whitespace.
     """
-    val = re.sub(r'[\n\r\u200B\t\xA0\s]', ' ', val)
-    val = re.sub(r'\s{2,}', ' ', val)
-    val = val.strip()
-    return val
\ No newline at end of file
+    # Without unprintable characters, the only whitespace is plain spaces; if none are doubled,
+    # there is nothing to collapse
+    if '  ' not in val and val.isprintable():
+        return val.strip()
+
+    # str.split treats zero-width spaces as part of words, so they are replaced first
+    if '\u200b' in val:
+        val = val.replace('\u200b', ' ')
+    return ' '.join(val.split())
\ No newline at end of file
@@ -40,6 +40,7 @@ class DownloadsTab(QWidget):
         header.resizeSection(statusColumn, 150)
         self.tableView.setColumnHidden(mirrorsColumn, True)
         self.tableView.setColumnHidden(idColumn, True)
+        self.seriesColumnVisible = None
 
         self.layout.addWidget(self.tableView)
 
@@ -51,7 +52,12 @@ class DownloadsTab(QWidget):
         :type job: DownloadJob
         """
         self.model.addRows([job])
-        if any([record.series for record in self.model.records]):
+        # Only touch the Series column when its visibility actually changes
+        showSeries = self.model.seriesCount > 0
+        if showSeries == self.seriesColumnVisible:
+            return
+        self.seriesColumnVisible = showSeries
+        if showSeries:
             self.tableView.showColumn(self.model.headers.index("Series"))
         else:
             self.tableView.hideColumn(self.model.headers.index("Series"))
@@ -63,4 +69,7 @@ class DownloadsTab(QWidget):
         :param job: The download job to update.
         :type job: DownloadJob
         """
-        self.model.dataChanged.emit(self.model.index(self.model.records.index(job), 0), self.model.index(self.model.records.index(job), len(self.model.headers) - 1))
+        row = self.model.rowForJob(job)
+        if row is None:
+            return
+        self.model.dataChanged.emit(self.model.index(row, 0), self.model.index(row, self.model.lastColumn))
@@ -1,7 +1,6 @@
-from PySide6.QtCore import Signal, QStringListModel, Qt
+from PySide6.QtCore import Signal, QStringListModel, Qt, QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QCompleter, QHeaderView
 
-from src.books.core.models.book import Book
 from src.books.view_models.library_table_model import LibraryTableModel
 from src.books.view_models.multi_column_sort_proxy_model import MultiColumnSortProxyModel
 from src.books.views.library_table_view import LibraryTableView
@@ -11,10 +10,10 @@ class LibraryTab(QWidget):
     """
     Tab widget for displaying and managing the library of books.
 
-    :signal bookRemoved: Emitted when a book is removed from the library.
+    :signal booksRemoved: Emitted when books are removed from the library.
     :signal sendToDeviceRequested: Emitted when books are requested to be sent to a device.
     """
-    bookRemoved = Signal(Book)
+    booksRemoved = Signal(list)
     sendToDeviceRequested = Signal(object)
 
     def __init__(self, library, kindle, parent=None):
@@ -50,11 +49,8 @@ class LibraryTab(QWidget):
         self.formatFilterComboBox.addItem("All Formats")
 
         # Get unique titles, authors, series, and types
-        authors = sorted(set(book.author for book in library.books))
-        titles = sorted(set(book.title for book in library.books))
-        series_list = sorted(set(book.series for book in library.books if book.series))
-        types = sorted(set(book.type for book in library.books if book.type))
-        formats = sorted(set(book.format for book in library.books if book.format))
+        self.facets = self._collectFacets(library.books)
+        authors, titles, series_list, types, formats = self.facets
 
         self.authorCompleterModel = QStringListModel(authors)
         self.authorCompleter = QCompleter(self.authorCompleterModel)
@@ -87,8 +83,8 @@ class LibraryTab(QWidget):
 
         # Table setup
         self.library = library
-        self.library.bookRemoved.connect(self.refreshTable)
-        self.library.bookRemoved.connect(self.bookRemoved)
+        self.library.booksRemoved.connect(self.refreshTable)
+        self.library.booksRemoved.connect(self.booksRemoved)
 
         self.model = LibraryTableModel(self.library)
         self.proxyModel = MultiColumnSortProxyModel()
@@ -99,10 +95,10 @@ class LibraryTab(QWidget):
         self.tableView = LibraryTableView(self)
         self.tableView.setModel(self.proxyModel)
 
-        authorColumn = self.model.headers.index("Author")
-        titleColumn = self.model.headers.index("Title")
-        idColumn = self.model.headers.index("ID")
-        onDeviceColumn = self.model.headers.index("On Device")
+        authorColumn = self.model.authorColumn
+        titleColumn = self.model.titleColumn
+        idColumn = self.model.idColumn
+        onDeviceColumn = self.model.onDeviceColumn
 
         self.proxyModel.sort(authorColumn, Qt.SortOrder.AscendingOrder)
 
@@ -118,6 +114,12 @@ class LibraryTab(QWidget):
 
         self.layout.addWidget(self.tableView)
 
+        # Apply text filters once typing pauses rather than on every keystroke
+        self.filterTimer = QTimer(self)
+        self.filterTimer.setSingleShot(True)
+        self.filterTimer.setInterval(150)
+        self.filterTimer.timeout.connect(self.applyTextFilters)
+
         # Connect filter inputs to proxy model
         self.authorFilterEdit.textChanged.connect(self.onAuthorFilterChanged)
         self.titleFilterEdit.textChanged.connect(self.onTitleFilterChanged)
@@ -125,14 +127,30 @@ class LibraryTab(QWidget):
         self.typeFilterComboBox.currentIndexChanged.connect(self.onTypeFilterChanged)
         self.formatFilterComboBox.currentIndexChanged.connect(self.onFormatFilterChanged)
 
-    def onAuthorFilterChanged(self, text):
-        self.proxyModel.setAuthorFilterPattern(text)
+    def onAuthorFilterChanged(self, _text):
+        self.filterTimer.start()
+
+    def onTitleFilterChanged(self, _text):
+        self.filterTimer.start()
+
+    def onSeriesFilterChanged(self, _text):
+        self.filterTimer.start()
+
+    def applyTextFilters(self):
+        """
+        Apply the author, title, and series filters that changed since they were last applied.
+        """
+        author = self.authorFilterEdit.text()
+        if author != self.proxyModel.authorFilterPattern:
+            self.proxyModel.setAuthorFilterPattern(author)
 
-    def onTitleFilterChanged(self, text):
-        self.proxyModel.setTitleFilterPattern(text)
+        title = self.titleFilterEdit.text()
+        if title != self.proxyModel.titleFilterPattern:
+            self.proxyModel.setTitleFilterPattern(title)
 
-    def onSeriesFilterChanged(self, text):
-        self.proxyModel.setSeriesFilterPattern(text)
+        series = self.seriesFilterEdit.text()
+        if series != self.proxyModel.seriesFilterPattern:
+            self.proxyModel.setSeriesFilterPattern(series)
 
     def onTypeFilterChanged(self, _index):
         selected_type = self.typeFilterComboBox.currentText()
@@ -150,12 +168,13 @@ class LibraryTab(QWidget):
 
     def importBookFromDownloadResult(self, downloadResult):
         """
-        Import a book into the library from a download result.
+        Import a book into the library from a download result. The downloaded file is a temporary
+        file, so it is moved into the library.
 
         :param downloadResult: The result of a download.
         :type downloadResult: DownloadResult
         """
-        self.importBook(downloadResult.filePath, downloadResult.job)
+        self.library.addBook(downloadResult.filePath, downloadResult.job, move=True)
 
     def importBook(self, filePath, job=None):
         """
@@ -172,48 +191,90 @@ class LibraryTab(QWidget):
         """
         Refresh the table view to reflect the current state of the library.
         """
-        self.model.beginResetModel()
-        self.model.endResetModel()
-        self.tableView.resizeColumnsToContents()
+        self.model.refresh()
         # Update completers
         self.updateCompleters()
 
+    @staticmethod
+    def _collectFacets(books) -> tuple[list, list, list, list, list]:
+        """
+        Collect the sorted unique authors, titles, series, types, and formats of the given books
+        in a single pass.
+
+        :param books: The books to collect facets from.
+        :type books: list of Book
+        :return: The sorted authors, titles, series, types, and formats.
+        :rtype: tuple[list, list, list, list, list]
+        """
+        authors = set()
+        titles = set()
+        series_set = set()
+        types = set()
+        formats = set()
+
+        for book in books:
+            authors.add(book.author)
+            titles.add(book.title)
+            if book.series:
+                series_set.add(book.series)
+            if book.type:
+                types.add(book.type)
+            if book.format:
+                formats.add(book.format)
+
+        return sorted(authors), sorted(titles), sorted(series_set), sorted(types), sorted(formats)
+
     def updateCompleters(self):
-        authors = sorted(set(book.author for book in self.library.books))
-        titles = sorted(set(book.title for book in self.library.books))
-        series_list = sorted(set(book.series for book in self.library.books if book.series))
-        types = sorted(set(book.type for book in self.library.books if book.type))
-        formats = sorted(set(book.format for book in self.library.books if book.format))
-
-        self.authorCompleterModel.setStringList(authors)
-        self.titleCompleterModel.setStringList(titles)
-        self.seriesCompleterModel.setStringList(series_list)
-
-        # Update type combo box
-        current_type = self.typeFilterComboBox.currentText()
-        self.typeFilterComboBox.clear()
-        self.typeFilterComboBox.addItem("All Types")
-        self.typeFilterComboBox.addItems(types)
+        facets = self._collectFacets(self.library.books)
+        if facets == self.facets:
+            return
+
+        authors, titles, series_list, types, formats = facets
+        oldAuthors, oldTitles, oldSeries, oldTypes, oldFormats = self.facets
+        self.facets = facets
+
+        # Only rebuild the completers whose contents changed
+        if authors != oldAuthors:
+            self.authorCompleterModel.setStringList(authors)
+        if titles != oldTitles:
+            self.titleCompleterModel.setStringList(titles)
+        if series_list != oldSeries:
+            self.seriesCompleterModel.setStringList(series_list)
+
+        if types != oldTypes:
+            self._repopulateFilterComboBox(self.typeFilterComboBox, "All Types", types)
+        if formats != oldFormats:
+            self._repopulateFilterComboBox(self.formatFilterComboBox, "All Formats", formats)
+
+    @staticmethod
+    def _repopulateFilterComboBox(comboBox: QComboBox, allItem: str, items: list):
+        """
+        Replace the items of a filter combo box, keeping the current selection if it still exists.
 
-        # Restore previous selection if possible
-        index = self.typeFilterComboBox.findText(current_type)
-        if index >= 0:
-            self.typeFilterComboBox.setCurrentIndex(index)
-        else:
-            self.typeFilterComboBox.setCurrentIndex(0)  # Default to 'All'
+        Signals are blocked while the items are replaced, and currentIndexChanged is emitted once
+        afterwards if the selected item changed.
 
-        # Update format combo box
-        current_format = self.formatFilterComboBox.currentText()
-        self.formatFilterComboBox.clear()
-        self.formatFilterComboBox.addItem("All Formats")
-        self.formatFilterComboBox.addItems(formats)
+        :param comboBox: The combo box to repopulate.
+        :type comboBox: QComboBox
+        :param allItem: The item that disables the filter.
+        :type allItem: str
+        :param items: The filter items.
+        :type items: list
+        """
+        currentText = comboBox.currentText()
+
+        comboBox.blockSignals(True)
+        comboBox.clear()
+        comboBox.addItem(allItem)
+        comboBox.addItems(items)
 
         # Restore previous selection if possible
-        index = self.formatFilterComboBox.findText(current_format)
-        if index >= 0:
-            self.formatFilterComboBox.setCurrentIndex(index)
-        else:
-            self.formatFilterComboBox.setCurrentIndex(0)
+        index = comboBox.findText(currentText)
+        comboBox.setCurrentIndex(index if index >= 0 else 0)
+        comboBox.blockSignals(False)
+
+        if comboBox.currentText() != currentText:
+            comboBox.currentIndexChanged.emit(comboBox.currentIndex())
 
     def librarySize(self) -> int:
         """
@@ -239,7 +300,6 @@ class LibraryTab(QWidget):
         :type books: list
         """
         self.model.setKindleBooks(books)
-        self.refreshTable()
 
     def kindleConnected(self):
         """
@@ -264,10 +324,9 @@ class LibraryTab(QWidget):
 
     def newBookOnDevice(self, book):
         """
-        Add a new book to the device and refresh the table.
+        Add a new book to the device and update its On Device column.
 
         :param book: The book to add to the device.
         :type book: Book
         """
         self.tableView.newBookOnDevice(book)
-        self.refreshTable()
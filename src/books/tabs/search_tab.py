@@ -1,3 +1,4 @@
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QPushButton, QHeaderView, \
     QMessageBox
 
@@ -76,11 +77,19 @@ class SearchTab(QWidget):
         header.setSectionResizeMode(titleColumn, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(seriesColumn, QHeaderView.ResizeMode.Stretch)
         self.tableView.setColumnHidden(mirrorsColumn, True)
+        self.seriesColumnVisible = None
 
         self.tableView.downloadRequested.connect(self.downloadFile)
 
         self.layout.addWidget(self.tableView)
 
+        # Records streamed in by the search are added to the table in batches
+        self.pendingRecords = []
+        self.flushTimer = QTimer(self)
+        self.flushTimer.setSingleShot(True)
+        self.flushTimer.setInterval(50)
+        self.flushTimer.timeout.connect(self.flushRecords)
+
     def startSearch(self):
         """
         Start a search based on the user's input.
@@ -100,6 +109,8 @@ class SearchTab(QWidget):
         self.searchFormat.setEnabled(False)
         self.searchButton.setEnabled(False)
 
+        self.flushTimer.stop()
+        self.pendingRecords = []
         self.model.clearRows()
 
         self.searchWorker = SearchThread(author, title, fmt)
@@ -112,14 +123,31 @@ class SearchTab(QWidget):
 
     def addRecord(self, record):
         """
-        Add a search result record to the table.
+        Queue a search result record to be added to the table.
 
         :param record: The search result record to add.
         :type record: SearchResult
         """
-        self.model.addRows([record])
-        # If any records have a series, show the series column; otherwise hide it
-        if any([record.series for record in self.model.records]):
+        self.pendingRecords.append(record)
+        if not self.flushTimer.isActive():
+            self.flushTimer.start()
+
+    def flushRecords(self):
+        """
+        Add the queued search result records to the table in a single insert.
+        """
+        self.flushTimer.stop()
+        if not self.pendingRecords:
+            return
+        self.model.addRows(self.pendingRecords)
+        self.pendingRecords = []
+        # If any records have a series, show the series column; otherwise hide it. Only touch the
+        # column when its visibility actually changes
+        showSeries = self.model.seriesCount > 0
+        if showSeries == self.seriesColumnVisible:
+            return
+        self.seriesColumnVisible = showSeries
+        if showSeries:
             self.tableView.showColumn(self.model.headers.index("Series"))
         else:
             self.tableView.hideColumn(self.model.headers.index("Series"))
@@ -128,6 +156,7 @@ class SearchTab(QWidget):
         """
         Handle the completion of a search.
         """
+        self.flushRecords()
         self.authorInput.setEnabled(True)
         self.searchFormat.setEnabled(True)
         self.searchButton.setEnabled(True)
@@ -140,6 +169,7 @@ class SearchTab(QWidget):
         :param error_message: The error message.
         :type error_message: str
         """
+        self.flushRecords()
         QMessageBox.critical(self, "Search Error", f"An error occurred: {error_message}")
         self.authorInput.setEnabled(True)
         self.searchFormat.setEnabled(True)
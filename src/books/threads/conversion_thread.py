@@ -1,5 +1,9 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from PySide6.QtCore import QThread, Signal
 
+from src.books.core.log import Log
 from src.books.core.models.book import Book
 
 
@@ -17,6 +21,9 @@ class ConversionThread(QThread):
     conversionError = Signal(Book)
     conversionFinished = Signal()
 
+    # Number of books converted and copied to the device at the same time
+    maxWorkers = 3
+
     def __init__(self, kindle, books):
         """
         Initialize the ConversionWorker.
@@ -37,31 +44,63 @@ class ConversionThread(QThread):
         # Emit signal that conversion has started
         self.conversionStarted.emit()
 
-        # Process each book individually
-        for book in self.books:
-            # Try to convert and send to the Kindle; emit appropriate signal based on the outcome
-            if not self.convert(book):
-                self.conversionError.emit(book)
-            else:
-                self.conversionSuccess.emit(book)
+        # Convert and send the books in parallel; emit the appropriate signal as each one finishes
+        baseNames = self.deviceBaseNames(self.books)
+        with ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+            future_to_book = {executor.submit(self.convert, book, baseNames[book.id]): book for book in self.books}
+            for future in as_completed(future_to_book):
+                book = future_to_book[future]
+                if not future.result():
+                    self.conversionError.emit(book)
+                else:
+                    self.conversionSuccess.emit(book)
 
         # Emit signal when all conversions are finished
         self.conversionFinished.emit()
 
-    def convert(self, book) -> bool:
+    @staticmethod
+    def deviceBaseNames(books) -> dict[str, str]:
+        """
+        Choose the names the books are saved under on the device, without their extensions.
+
+        Books are converted and copied at the same time, so books whose files have the same name
+        are numbered, e.g. "Dune (2)", rather than overwriting each other on the device.
+
+        :param books: The books to be sent.
+        :type books: list of Book
+        :return: The name of each book's file on the device, by book ID.
+        :rtype: dict[str, str]
+        """
+        baseNames = {}
+        used = set()
+        for book in books:
+            baseName = os.path.splitext(os.path.basename(book.path))[0]
+            name = baseName
+            number = 2
+            # The Kindle's file system ignores case
+            while name.casefold() in used:
+                name = f"{baseName} ({number})"
+                number += 1
+            used.add(name.casefold())
+            baseNames[book.id] = name
+        return baseNames
+
+    def convert(self, book, baseName) -> bool:
         """
         Convert the book and send it to the Kindle device.
 
         :param book: The book to be converted.
         :type book: Book
+        :param baseName: The name of the book's file on the device, without its extension.
+        :type baseName: str
         :return: True if the conversion is successful, False otherwise.
         :rtype: bool
         """
         try:
             # Send the book to the Kindle device
-            self.kindle.sendToDevice(book)
+            self.kindle.sendToDevice(book, baseName)
             return True
         except Exception as e:
             # Log the error if conversion fails
-            print(e)
+            Log.error(f"Failed to send {book.path} to the device: {e}")
             return False
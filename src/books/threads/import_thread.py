@@ -11,12 +11,12 @@ class ImportThread(QThread):
 
     :signal importStarted: Emitted when the import process starts.
     :signal importSuccess: Emitted when a book is successfully imported.
-    :signal importError: Emitted when a book fails to import.
+    :signal importError: Emitted with the file path when a book fails to import.
     :signal importFinished: Emitted when all books are processed.
     """
     importStarted = Signal()
     importSuccess = Signal(Book)
-    importError = Signal(Book)
+    importError = Signal(str)
     importFinished = Signal()
 
     def __init__(self, library: Library, filePaths):
@@ -39,31 +39,16 @@ class ImportThread(QThread):
         Log.info("Import started.")
         self.importStarted.emit()
 
-        # Attempt to import each book file
-        for filePath in self.filePaths:
-            self.importBook(filePath)
+        # Attempt to import each book file; metadata is read for several files at once
+        for filePath, book in self.library.addBooks(self.filePaths):
+            if not book:
+                # Handle the case where the book could not be added
+                Log.info(f"library.addBooks returned None for {filePath}")
+                self.importError.emit(filePath)
+            else:
+                self.importSuccess.emit(book)
 
         # Emit signal and log completion when all files are processed
         self.importFinished.emit()
         Log.info("Import finished.")
         self.msleep(100)
-
-    def importBook(self, filePath: str):
-        """
-        Import a single book into the library.
-
-        :param filePath: The path to the book file.
-        :type filePath: str
-        """
-        try:
-            # Add the book to the library
-            book = self.library.addBook(filePath)
-            if not book:
-                # Handle the case where the book could not be added
-                Log.info(f"library.addBook returned None for {filePath}")
-                self.importError.emit(book)
-            else:
-                self.importSuccess.emit(book)
-        except Exception as e:
-            # Log any exceptions encountered during import
-            Log.info(f"Error importing {filePath}: {e}")
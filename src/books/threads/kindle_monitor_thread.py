@@ -3,12 +3,13 @@ import shutil
 import subprocess
 import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from typing import Optional
 
 import psutil
 from PySide6.QtCore import QThread, Signal
 
-from src.books.core.constants import ebookExtensions
+from src.books.core.constants import ebookSuffixes
 from src.books.core.config import Config
 from src.books.core.log import Log
 from src.books.core.models.book import createBookFromFile, Book
@@ -27,17 +28,22 @@ class KindleMonitorThread(QThread):
     kindleConnected = Signal()
     kindleDisconnected = Signal()
 
-    def __init__(self, parent=None):
+    def __init__(self, config: Config, parent=None):
         """
         Initialize the Kindle thread.
 
+        :param config: The configuration used to read and convert books.
+        :type config: Config
         :param parent: The parent QObject, if any.
         :type parent: QObject, optional
         """
         super().__init__(parent)
+        self.config = config
         self.books = []
+        self.bookPaths = frozenset()
         self.device = None
         self.mountpoint = None
+        self.partitions = None
         self.running = False
 
     def run(self):
@@ -63,11 +69,18 @@ class KindleMonitorThread(QThread):
         """
         Check for connected Kindle devices and update status.
         """
+        # Nothing can have been connected or disconnected if the mounted partitions are unchanged
+        partitions = psutil.disk_partitions()
+        signature = [(device.device, device.mountpoint) for device in partitions]
+        if signature == self.partitions:
+            return
+        self.partitions = signature
+
         new_device = None
         new_mountpoint = None
 
         # Iterate over all disk partitions to find Kindle device
-        for device in psutil.disk_partitions():
+        for device in partitions:
             if 'kindle' in device.device.lower() or 'kindle' in device.mountpoint.lower():
                 new_device = device.device
                 new_mountpoint = device.mountpoint
@@ -82,8 +95,10 @@ class KindleMonitorThread(QThread):
                         break
 
         if self.mountpoint and not new_mountpoint:
-            # Kindle was disconnected
+            # Kindle was disconnected; forget its books, so they are sent again when it reconnects
             self.mountpoint = None
+            self.books = []
+            self.bookPaths = frozenset()
             Log.info("Kindle disconnected.")
             self.kindleDisconnected.emit()
             return
@@ -110,17 +125,19 @@ class KindleMonitorThread(QThread):
             Log.info(f"Looking for books in {documents_path}")
 
             # Collect all book file paths
-            book_file_paths = []
-            for root, dirs, files in os.walk(documents_path):
-                for file in files:
-                    extensions = [f".{ext}" for ext in ebookExtensions]
-                    if os.path.splitext(file)[1].lower() in extensions:
-                        bookPath = os.path.join(root, file)
-                        book_file_paths.append(bookPath)
-
-            # Process the book files in parallel to create Book objects
+            book_file_paths = list(self.findBookFiles(documents_path))
+
+            # The books on the device can only have changed if their paths did
+            bookPaths = frozenset(book_file_paths)
+            if bookPaths == self.bookPaths:
+                return
+
+            # Process the book files in parallel to create Book objects, all found at the same time
+            added = datetime.now().isoformat(sep=' ', timespec='seconds')
             with ThreadPoolExecutor() as executor:
-                future_to_path = {executor.submit(createBookFromFile, path): path for path in book_file_paths}
+                future_to_path = {
+                    executor.submit(createBookFromFile, path, self.config, added): path for path in book_file_paths
+                }
                 for future in as_completed(future_to_path):
                     path = future_to_path[future]
                     try:
@@ -133,10 +150,27 @@ class KindleMonitorThread(QThread):
             Log.info(f"Failed to read from device: {e}")
             return
 
-        # If the list of books has changed, emit the booksChanged signal
-        if sorted(newBooks) != sorted(self.books):
-            self.books = newBooks
-            self.booksChanged.emit(self.books)
+        # The list of books has changed, emit the booksChanged signal
+        self.books = newBooks
+        self.bookPaths = bookPaths
+        self.booksChanged.emit(self.books)
+
+    @staticmethod
+    def findBookFiles(path: str):
+        """
+        Recursively find the supported book files in a directory.
+
+        :param path: The directory to search.
+        :type path: str
+        :return: The paths of the book files.
+        :rtype: Iterator[str]
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from KindleMonitorThread.findBookFiles(entry.path)
+                elif entry.name.lower().endswith(ebookSuffixes):
+                    yield entry.path
 
     @staticmethod
     def getVolumeLabel(driveLetter: str) -> Optional[str]:
@@ -180,7 +214,7 @@ class KindleMonitorThread(QThread):
         else:
             return None
 
-    def sendToDevice(self, book: Book) -> None:
+    def sendToDevice(self, book: Book, baseName: str = None) -> None:
         """
         Convert a book to MOBI format and send it to the Kindle device.
 
@@ -189,31 +223,39 @@ class KindleMonitorThread(QThread):
 
         :param book: The book to send to the device.
         :type book: Book
+        :param baseName: The name of the file on the device, without its extension; the name of
+            the converted file if not given.
+        :type baseName: str, optional
         """
         if not self.mountpoint:
             Log.info("Kindle device not found.")
             return
 
         try:
-            mobiPath = self.convertToMobi(book)
+            mobiPath = self.convertToMobi(book, self.config)
             if not mobiPath:
                 Log.info("Failed to convert to MOBI.")
                 return
 
             # Copy the MOBI file to the Kindle 'documents' directory
-            destination = os.path.join(self.mountpoint, 'documents', os.path.basename(mobiPath))
-            shutil.copy(mobiPath, destination)
+            fileName = os.path.basename(mobiPath)
+            if baseName:
+                fileName = baseName + os.path.splitext(fileName)[1]
+            destination = os.path.join(self.mountpoint, 'documents', fileName)
+            shutil.copyfile(mobiPath, destination)
             Log.info(f"Copied {mobiPath} to {destination}")
         except Exception as e:
             Log.info(f"Failed to copy file to device: {e}")
 
     @staticmethod
-    def convertToMobi(book: Book) -> Optional[str]:
+    def convertToMobi(book: Book, config: Config) -> Optional[str]:
         """
         Convert a book to MOBI format using ebook-convert.
 
         :param book: The book to convert.
         :type book: Book
+        :param config: The configuration giving the path to ebook-convert.
+        :type config: Config
         :return: The path to the converted MOBI file, or None if conversion failed.
         :rtype: Optional[str]
         """
@@ -222,7 +264,6 @@ class KindleMonitorThread(QThread):
             tempDir = tempfile.mkdtemp()
             baseName = os.path.splitext(os.path.basename(sourcePath))[0]
             outputPath = os.path.join(tempDir, f"{baseName}.azw3")
-            config = Config.load()
             args = []
 
             if config.pythonPath:
@@ -244,14 +285,16 @@ class KindleMonitorThread(QThread):
 
             Log.info(f"Converting {sourcePath} to MOBI with args: {args}")
 
-            result = subprocess.run(args, capture_output=True, text=True, encoding='utf-8')
+            # Only the return code and error output are used; discard the progress output
+            result = subprocess.run(
+                args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, encoding='utf-8'
+            )
 
             if result.returncode == 0:
                 Log.info("Conversion successful.")
                 return outputPath
             else:
                 Log.info(f"Conversion failed with return code: {result.returncode}")
-                Log.info(f"Standard Output: {result.stdout}")
                 Log.info(f"Standard Error: {result.stderr}")
                 return None
 
@@ -16,6 +16,11 @@ class DownloadsTableModel(QAbstractTableModel):
         super().__init__()
         self.headers = ["Author", "Title", "Series", "Format", "Size", "Mirrors", "Status", "ID"]
         self.records = data
+        self.rowByJobId = {record.id: row for row, record in enumerate(data)}
+        self.attrNames = [header.lower() for header in self.headers]
+        self.statusColumn = self.headers.index("Status")
+        self.lastColumn = len(self.headers) - 1
+        self.seriesCount = sum(1 for record in data if record.series)
 
     def rowCount(self, parent=QModelIndex()) -> int:
         """
@@ -54,8 +59,8 @@ class DownloadsTableModel(QAbstractTableModel):
             return None
         column = index.column()
         if role == Qt.ItemDataRole.DisplayRole:
-            return getattr(self.records[index.row()], self.headers[column].lower())
-        if role == Qt.ItemDataRole.TextAlignmentRole and column == self.headers.index("Status"):
+            return getattr(self.records[index.row()], self.attrNames[column])
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == self.statusColumn:
             return Qt.AlignmentFlag.AlignCenter
 
     def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
@@ -80,6 +85,8 @@ class DownloadsTableModel(QAbstractTableModel):
         """
         self.beginResetModel()
         self.records = []
+        self.rowByJobId = {}
+        self.seriesCount = 0
         self.endResetModel()
 
     def addRows(self, newRows):
@@ -90,6 +97,10 @@ class DownloadsTableModel(QAbstractTableModel):
         :type newRows: list
         """
         self.beginInsertRows(QModelIndex(), len(self.records), len(self.records) + len(newRows) - 1)
+        for row, record in enumerate(newRows, len(self.records)):
+            self.rowByJobId[record.id] = row
+            if record.series:
+                self.seriesCount += 1
         self.records.extend(newRows)
         self.endInsertRows()
 
@@ -104,10 +115,23 @@ class DownloadsTableModel(QAbstractTableModel):
         """
         return self.records[index]
 
+    def rowForJob(self, job) -> int | None:
+        """
+        Get the row of a download job.
+
+        :param job: The download job to look up.
+        :type job: Job
+        :return: The row of the job, or None if it is not in the model.
+        :rtype: int | None
+        """
+        return self.rowByJobId.get(job.id)
+
     def clearCompleted(self):
         """
         Clear all completed download jobs from the model.
         """
         self.beginResetModel()
         self.records = [record for record in self.records if record.status != "Success" and record.status != "Error"]
+        self.rowByJobId = {record.id: row for row, record in enumerate(self.records)}
+        self.seriesCount = sum(1 for record in self.records if record.series)
         self.endResetModel()
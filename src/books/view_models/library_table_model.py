@@ -1,5 +1,10 @@
+import sys
+
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
+# The number of separate row ranges a refresh removes one at a time before resetting the model
+maxRemovedRanges = 16
+
 
 class LibraryTableModel(QAbstractTableModel):
     """
@@ -15,8 +20,29 @@ class LibraryTableModel(QAbstractTableModel):
         """
         super().__init__()
         self.library = library
+        self.books = list(library.books)
         self.headers = ["On Device", "Author", "Title", "Series", "Year", "Type", "Format", "Added", "ID"]
+        self.numColumns = len(self.headers)
+        self.lastColumn = self.numColumns - 1
+        self.onDeviceColumn = self.headers.index("On Device")
+        self.authorColumn = self.headers.index("Author")
+        self.titleColumn = self.headers.index("Title")
+        self.seriesColumn = self.headers.index("Series")
+        self.yearColumn = self.headers.index("Year")
+        self.typeColumn = self.headers.index("Type")
+        self.formatColumn = self.headers.index("Format")
+        self.idColumn = self.headers.index("ID")
+        self.rowById = {book.id: row for row, book in enumerate(self.books)}
         self.kindleBooks = []
+        self.kindleTitles = set()
+        self.years = {}
+        self.seriesLabels = {}
+        self.onDevice = {}
+        self.filterKeys = {}
+        self.yearKeys = {}
+        self.authorKeys = {}
+        for book in self.books:
+            self._cacheBook(book)
 
     def rowCount(self, parent=QModelIndex()) -> int:
         """
@@ -27,7 +53,7 @@ class LibraryTableModel(QAbstractTableModel):
         :return: Number of rows.
         :rtype: int
         """
-        return self.library.numBooks
+        return len(self.books)
 
     def columnCount(self, parent=QModelIndex()) -> int:
         """
@@ -38,7 +64,7 @@ class LibraryTableModel(QAbstractTableModel):
         :return: Number of columns.
         :rtype: int
         """
-        return 9
+        return self.numColumns
 
     def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
         """
@@ -51,36 +77,35 @@ class LibraryTableModel(QAbstractTableModel):
         :return: The data for the given index and role.
         :rtype: Any
         """
-        if role == Qt.ItemDataRole.DisplayRole:
-            if not index.isValid() or not (0 <= index.row() < self.library.numBooks):
-                return None
-            book = self.library.books[index.row()]
-            column = index.column()
-            if column == 0:
-                if book.title in [kindleBook.title for kindleBook in self.kindleBooks]:
-                    return "✓"
-                return ""
-            elif column == 1:
-                return book.author
-            elif column == 2:
-                return book.title
-            elif column == 3:
-                if book.seriesNumber:
-                    return f"{book.series} #{book.seriesNumber}"
-                return book.series
-            elif column == 4:
-                if book.published:
-                    return book.published.split('-')[0]
-            elif column == 5:
-                return book.type
-            elif column == 6:
-                return book.format
-            elif column == 7:
-                return book.added
-            elif column == 8:
-                return str(book.id)
-        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == 0:
-            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if index.column() == 0:
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if not index.isValid() or not (0 <= index.row() < len(self.books)):
+            return None
+        book = self.books[index.row()]
+        column = index.column()
+        if column == 0:
+            return self.onDevice.get(book.id, "")
+        elif column == 1:
+            return book.author
+        elif column == 2:
+            return book.title
+        elif column == 3:
+            return self.seriesLabels.get(book.id)
+        elif column == 4:
+            return self.years.get(book.id)
+        elif column == 5:
+            return book.type
+        elif column == 6:
+            return book.format
+        elif column == 7:
+            return book.added
+        elif column == 8:
+            return str(book.id)
 
     def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
         """
@@ -95,10 +120,180 @@ class LibraryTableModel(QAbstractTableModel):
         :return: The header data.
         :rtype: str
         """
-        if section == 0:
+        if role != Qt.ItemDataRole.DisplayRole or orientation != Qt.Orientation.Horizontal or section == 0:
             return None
-        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
-            return self.headers[section]
+        return self.headers[section]
+
+    def refresh(self):
+        """
+        Synchronize the model with the library.
+
+        Books removed from the library are announced as row removals and books appended to the
+        library as row insertions, so attached proxies and views keep their sort order, selection
+        and persistent indexes. The remaining rows are announced as changed. When the deleted books
+        are scattered across many separate ranges, the model is reset once instead.
+        """
+        self.years = {}
+        self.seriesLabels = {}
+        self.onDevice = {}
+        self.filterKeys = {}
+        self.yearKeys = {}
+        self.authorKeys = {}
+        for book in self.library.books:
+            self._cacheBook(book)
+
+        # Find the rows of deleted books, as contiguous ranges from the bottom up
+        libraryIds = {book.id for book in self.library.books}
+        removedRanges = []
+        row = len(self.books) - 1
+        while row >= 0:
+            if self.books[row].id in libraryIds:
+                row -= 1
+                continue
+            last = row
+            while row > 0 and self.books[row - 1].id not in libraryIds:
+                row -= 1
+            removedRanges.append((row, last))
+            row -= 1
+
+        if len(removedRanges) > maxRemovedRanges:
+            # Each removal makes the proxy remap and re-sort; past a handful, one reset is cheaper
+            self._reset()
+            return
+
+        for first, last in removedRanges:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.books[first:last + 1]
+            self.endRemoveRows()
+
+        numRows = len(self.books)
+        remaining = self.library.books[:numRows]
+        if [book.id for book in remaining] != [book.id for book in self.books]:
+            # The library was reordered; fall back to a full reset
+            self._reset()
+            return
+
+        self.books = remaining
+        self.rowById = {book.id: row for row, book in enumerate(self.books)}
+        if numRows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(numRows - 1, self.lastColumn), [Qt.ItemDataRole.DisplayRole]
+            )
+
+        numBooks = len(self.library.books)
+        if numBooks > numRows:
+            self.beginInsertRows(QModelIndex(), numRows, numBooks - 1)
+            for row in range(numRows, numBooks):
+                self.rowById[self.library.books[row].id] = row
+            self.books.extend(self.library.books[numRows:])
+            self.endInsertRows()
+
+    def _reset(self):
+        """
+        Replace every row with the books of the library in a single model reset.
+        """
+        self.beginResetModel()
+        self.books = list(self.library.books)
+        self.rowById = {book.id: row for row, book in enumerate(self.books)}
+        self.endResetModel()
+
+    def bookAt(self, row: int):
+        """
+        Get the book displayed in a row.
+
+        :param row: The row in the model.
+        :type row: int
+        :return: The book in the row.
+        :rtype: Book
+        """
+        return self.books[row]
+
+    def filterFields(self, row: int) -> tuple[str, str, str, str, str]:
+        """
+        Get the values the library filters and sorts a row by.
+
+        :param row: The row in the model.
+        :type row: int
+        :return: The case-folded title, author, and series, and the type and format of the book.
+        :rtype: tuple[str, str, str, str, str]
+        """
+        return self.filterKeys[self.books[row].id]
+
+    def yearKey(self, row: int) -> tuple[int, ...]:
+        """
+        Get the value the library sorts a row by when sorting by year.
+
+        :param row: The row in the model.
+        :type row: int
+        :return: The year, month, and day the book was published, or (0, 0, 0) if unknown.
+        :rtype: tuple[int, ...]
+        """
+        return self.yearKeys[self.books[row].id]
+
+    def authorKey(self, row: int) -> tuple[str, str, str]:
+        """
+        Get the value the library sorts a row by when sorting by author.
+
+        :param row: The row in the model.
+        :type row: int
+        :return: The case-folded author, series, and title of the book.
+        :rtype: tuple[str, str, str]
+        """
+        return self.authorKeys[self.books[row].id]
+
+    def updateBook(self, book):
+        """
+        Replace a book in the model and announce that its row changed.
+
+        :param book: The updated book.
+        :type book: Book
+        """
+        row = self.rowById.get(book.id)
+        if row is None:
+            return
+        self.books[row] = book
+        self._cacheBook(book)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.lastColumn), [Qt.ItemDataRole.DisplayRole])
+
+    def _cacheBook(self, book):
+        """
+        Precompute the On Device, Series and Year display values of a book, and the values it is
+        filtered and sorted by.
+
+        :param book: The book to cache display values for.
+        :type book: Book
+        """
+        if book.seriesNumber:
+            self.seriesLabels[book.id] = f"{book.series} #{book.seriesNumber}"
+        else:
+            self.seriesLabels[book.id] = book.series
+        self.years[book.id] = book.published.split('-', 1)[0] if book.published else None
+        self.onDevice[book.id] = "✓" if book.title in self.kindleTitles else ""
+        self.filterKeys[book.id] = (
+            (book.title or '').casefold(),
+            (book.author or '').casefold(),
+            (self.seriesLabels[book.id] or '').casefold(),
+            # Types and formats repeat across the library; interned, equal values share one string
+            sys.intern(book.type or ''),
+            sys.intern(book.format or ''),
+        )
+        title, author, series, _, _ = self.filterKeys[book.id]
+        self.authorKeys[book.id] = (author, series, title)
+        try:
+            self.yearKeys[book.id] = tuple(int(part) for part in book.published.split('-'))
+        except (AttributeError, ValueError):
+            self.yearKeys[book.id] = (0, 0, 0)
+
+    def _onDeviceChanged(self):
+        """
+        Recompute the On Device column and announce that it changed.
+        """
+        self.onDevice = {book.id: "✓" if book.title in self.kindleTitles else "" for book in self.books}
+        if self.books:
+            column = self.onDeviceColumn
+            self.dataChanged.emit(
+                self.index(0, column), self.index(len(self.books) - 1, column), [Qt.ItemDataRole.DisplayRole]
+            )
 
     def setKindleBooks(self, books: list):
         """
@@ -108,6 +303,8 @@ class LibraryTableModel(QAbstractTableModel):
         :type books: list
         """
         self.kindleBooks = books
+        self.kindleTitles = {kindleBook.title for kindleBook in books}
+        self._onDeviceChanged()
 
     def newBookOnDevice(self, book):
         """
@@ -116,5 +313,9 @@ class LibraryTableModel(QAbstractTableModel):
         :param book: The book to add.
         :type book: Book
         """
-        if book not in self.kindleBooks:
+        # On Device is matched by title on purpose, since Kindle books have their own IDs; the title
+        # set answers membership without scanning the list
+        if book.title not in self.kindleTitles:
             self.kindleBooks.append(book)
+            self.kindleTitles.add(book.title)
+            self._onDeviceChanged()
@@ -1,3 +1,5 @@
+from operator import attrgetter
+
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
 from src.books.core.models.metadata_result import MetadataResult
@@ -17,6 +19,7 @@ class MetadataTableModel(QAbstractTableModel):
         """
         super().__init__()
         self.headers = ["Title", "Author", "Published", "Description"]
+        self.getters = tuple(attrgetter(header.lower().replace(" ", "_")) for header in self.headers)
         self.records = data
 
     def rowCount(self, parent=QModelIndex()) -> int:
@@ -56,7 +59,7 @@ class MetadataTableModel(QAbstractTableModel):
             return None
         column = index.column()
         if role == Qt.ItemDataRole.DisplayRole:
-            return getattr(self.records[index.row()], self.headers[column].lower().replace(" ", "_"))
+            return self.getters[column](self.records[index.row()])
         if role == Qt.ItemDataRole.TextAlignmentRole:
             return Qt.AlignmentFlag.AlignLeft
 
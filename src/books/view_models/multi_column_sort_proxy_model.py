@@ -1,6 +1,6 @@
-from datetime import datetime
+import sys
 
-from PySide6.QtCore import QSortFilterProxyModel, Qt, QModelIndex
+from PySide6.QtCore import QSortFilterProxyModel, QModelIndex
 
 from src.books.view_models.library_table_model import LibraryTableModel
 
@@ -15,27 +15,39 @@ class MultiColumnSortProxyModel(QSortFilterProxyModel):
         self.titleFilterPattern = ''
         self.authorFilterPattern = ''
         self.seriesFilterPattern = ''
+        self.titleFilterFolded = ''
+        self.authorFilterFolded = ''
+        self.seriesFilterFolded = ''
         self.typeFilter = None
         self.formatFilter = None
+        self.predicate = None
 
     def setTitleFilterPattern(self, pattern):
         self.titleFilterPattern = pattern
+        self.titleFilterFolded = pattern.casefold()
+        self.predicate = self._buildPredicate()
         self.invalidateFilter()
 
     def setAuthorFilterPattern(self, pattern):
         self.authorFilterPattern = pattern
+        self.authorFilterFolded = pattern.casefold()
+        self.predicate = self._buildPredicate()
         self.invalidateFilter()
 
     def setSeriesFilterPattern(self, pattern):
         self.seriesFilterPattern = pattern
+        self.seriesFilterFolded = pattern.casefold()
+        self.predicate = self._buildPredicate()
         self.invalidateFilter()
 
     def setTypeFilter(self, type_value):
-        self.typeFilter = type_value
+        self.typeFilter = sys.intern(type_value) if type_value else None
+        self.predicate = self._buildPredicate()
         self.invalidateFilter()
 
     def setFormatFilter(self, format_value):
-        self.formatFilter = format_value
+        self.formatFilter = sys.intern(format_value) if format_value else None
+        self.predicate = self._buildPredicate()
         self.invalidateFilter()
 
     def filterAcceptsRow(self, source_row, source_parent):
@@ -44,36 +56,48 @@ class MultiColumnSortProxyModel(QSortFilterProxyModel):
         if not isinstance(model, LibraryTableModel):
             return super().filterAcceptsRow(source_row, source_parent)
 
-        # Filter based on title, author, series, and type
-        indexTitle = model.index(source_row, model.headers.index("Title"), source_parent)
-        indexAuthor = model.index(source_row, model.headers.index("Author"), source_parent)
-        indexSeries = model.index(source_row, model.headers.index("Series"), source_parent)
-        indexType = model.index(source_row, model.headers.index("Type"), source_parent)
-        indexFormat = model.index(source_row, model.headers.index("Format"), source_parent)
+        # Only the active filters are checked; with none active every row is accepted
+        if self.predicate is None:
+            return True
+        return self.predicate(model.filterFields(source_row))
 
-        dataTitle = model.data(indexTitle, Qt.ItemDataRole.DisplayRole) or ''
-        dataAuthor = model.data(indexAuthor, Qt.ItemDataRole.DisplayRole) or ''
-        dataSeries = model.data(indexSeries, Qt.ItemDataRole.DisplayRole) or ''
-        dataType = model.data(indexType, Qt.ItemDataRole.DisplayRole) or ''
-        dataFormat = model.data(indexFormat, Qt.ItemDataRole.DisplayRole) or ''
-
-        # Case-insensitive matching
-        if self.titleFilterPattern and self.titleFilterPattern.lower() not in dataTitle.lower():
-            return False
-
-        if self.authorFilterPattern and self.authorFilterPattern.lower() not in dataAuthor.lower():
-            return False
-
-        if self.seriesFilterPattern and self.seriesFilterPattern.lower() not in dataSeries.lower():
-            return False
-
-        if self.typeFilter and self.typeFilter != dataType:
-            return False
-
-        if self.formatFilter and self.formatFilter != dataFormat:
-            return False
+    def _buildPredicate(self):
+        """
+        Build a predicate that checks a row's filter fields against only the active filters.
 
-        return True
+        :return: A function taking the row's filter fields and returning whether the row is
+            accepted, or None if no filter is active.
+        :rtype: Callable[[tuple], bool] | None
+        """
+        checks = []
+
+        # Exact type and format matches come first; they are the cheapest checks and usually
+        # reject the most rows
+        if self.typeFilter:
+            checks.append(lambda fields, value=self.typeFilter: fields[3] == value)
+        if self.formatFilter:
+            checks.append(lambda fields, value=self.formatFilter: fields[4] == value)
+
+        # Case-insensitive matching against the case-folded patterns, longest (and usually most
+        # selective) pattern first
+        patterns = [
+            (pattern, column)
+            for pattern, column in (
+                (self.titleFilterFolded, 0),
+                (self.authorFilterFolded, 1),
+                (self.seriesFilterFolded, 2),
+            )
+            if pattern
+        ]
+        patterns.sort(key=lambda item: len(item[0]), reverse=True)
+        for pattern, column in patterns:
+            checks.append(lambda fields, pattern=pattern, column=column: pattern in fields[column])
+
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda fields: all(check(fields) for check in checks)
 
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
         """
@@ -91,43 +115,13 @@ class MultiColumnSortProxyModel(QSortFilterProxyModel):
         if not isinstance(model, LibraryTableModel):
             return super().lessThan(left, right)
 
-        authorIndex = model.headers.index("Author")
-        seriesIndex = model.headers.index("Series")
-        titleIndex = model.headers.index("Title")
-        publishedIndex = model.headers.index("Year")
+        authorIndex = model.authorColumn
+        publishedIndex = model.yearColumn
 
         if self.sortColumn() == authorIndex:
-            leftAuthor = model.data(left.siblingAtColumn(authorIndex), Qt.ItemDataRole.DisplayRole).lower()
-            rightAuthor = model.data(right.siblingAtColumn(authorIndex), Qt.ItemDataRole.DisplayRole).lower()
-
-            leftSeries = model.data(left.siblingAtColumn(seriesIndex), Qt.ItemDataRole.DisplayRole) or ''
-            leftSeries = leftSeries.lower()
-
-            rightSeries = model.data(right.siblingAtColumn(seriesIndex), Qt.ItemDataRole.DisplayRole) or ''
-            rightSeries = rightSeries.lower()
-
-            leftTitle = model.data(left.siblingAtColumn(titleIndex), Qt.ItemDataRole.DisplayRole).lower()
-            rightTitle = model.data(right.siblingAtColumn(titleIndex), Qt.ItemDataRole.DisplayRole).lower()
-
-            if leftAuthor != rightAuthor:
-                return leftAuthor < rightAuthor
-            elif leftSeries != rightSeries:
-                return leftSeries < rightSeries
-            return leftTitle < rightTitle
+            # Author, then series, then title
+            return model.authorKey(left.row()) < model.authorKey(right.row())
         elif self.sortColumn() == publishedIndex:
-            leftDate = model.data(left.siblingAtColumn(publishedIndex), Qt.ItemDataRole.DisplayRole)
-            rightDate = model.data(right.siblingAtColumn(publishedIndex), Qt.ItemDataRole.DisplayRole)
-
-            try:
-                leftDateParsed = datetime.strptime(leftDate, "%Y-%m-%d")
-            except (ValueError, TypeError):
-                leftDateParsed = datetime.min
-
-            try:
-                rightDateParsed = datetime.strptime(rightDate, "%Y-%m-%d")
-            except (ValueError, TypeError):
-                rightDateParsed = datetime.min
-
-            return leftDateParsed < rightDateParsed
+            return model.yearKey(left.row()) < model.yearKey(right.row())
         else:
             return super().lessThan(left, right)
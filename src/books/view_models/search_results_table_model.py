@@ -17,7 +17,9 @@ class SearchResultsTableModel(QAbstractTableModel):
         """
         super().__init__()
         self.headers = ["Author", "Title", "Series", "Format", "Size", "Score", "Mirrors"]
+        self.attrNames = [header.lower() for header in self.headers]
         self.records = data
+        self.seriesCount = sum(1 for record in data if record.series)
 
     def rowCount(self, parent=QModelIndex()) -> int:
         """
@@ -57,7 +59,7 @@ class SearchResultsTableModel(QAbstractTableModel):
         book = self.records[index.row()]
         column = index.column()
         if role == Qt.ItemDataRole.DisplayRole:
-            return getattr(book, self.headers[column].lower())
+            return getattr(book, self.attrNames[column])
 
     def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
         """
@@ -81,6 +83,7 @@ class SearchResultsTableModel(QAbstractTableModel):
         """
         self.beginResetModel()
         self.records = []
+        self.seriesCount = 0
         self.endResetModel()
 
     def addRows(self, newRows):
@@ -91,6 +94,7 @@ class SearchResultsTableModel(QAbstractTableModel):
         :type newRows: list
         """
         self.beginInsertRows(QModelIndex(), len(self.records), len(self.records) + len(newRows) - 1)
+        self.seriesCount += sum(1 for record in newRows if record.series)
         self.records.extend(newRows)
         self.endInsertRows()
 
@@ -104,10 +108,11 @@ class SearchResultsTableModel(QAbstractTableModel):
         :type order: Qt.SortOrder
         """
         self.layoutAboutToBeChanged.emit()
-        if self.headers[column].lower() == 'size':
+        attrName = self.attrNames[column]
+        if attrName == 'size':
             self.records.sort(key=lambda x: self.convertSizeToBytes(getattr(x, 'size')), reverse=order == Qt.SortOrder.DescendingOrder)
         else:
-            self.records.sort(key=lambda x: getattr(x, self.headers[column].lower()), reverse=order == Qt.SortOrder.DescendingOrder)
+            self.records.sort(key=lambda x: getattr(x, attrName), reverse=order == Qt.SortOrder.DescendingOrder)
         self.layoutChanged.emit()
 
     @staticmethod
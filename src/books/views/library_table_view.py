@@ -37,6 +37,19 @@ class LibraryTableView(QTableView):
         self.setSortingEnabled(True)
         self.setFont(getSansSerifFont())
 
+        # Build the context menu once and reuse it for every right-click
+        self.contextMenu = QMenu(self)
+        self.openAction = self.contextMenu.addAction("Open")
+        self.editAction = self.contextMenu.addAction("Edit...")
+        self.contextMenu.addSeparator()
+        researchMenu = self.contextMenu.addMenu("Research")
+        self.researchAuthorAction = researchMenu.addAction("Author")
+        self.researchTitleAction = researchMenu.addAction("Title")
+        self.contextMenu.addSeparator()
+        self.showAction = self.contextMenu.addAction("Show in Folder")
+        self.sendToDeviceAction = self.contextMenu.addAction("Send to Device")
+        self.contextMenu.addSeparator()
+        self.deleteAction = self.contextMenu.addAction("Delete...")
 
     def showContextMenu(self, pos):
         """
@@ -45,43 +58,40 @@ class LibraryTableView(QTableView):
         :param pos: The position to show the context menu.
         :type pos: QPoint
         """
-        contextMenu = QMenu(self)
-
-        # Add actions to the context menu
-        openAction = contextMenu.addAction("Open")
-        editAction = contextMenu.addAction("Edit...")
-        contextMenu.addSeparator()
-        researchMenu = contextMenu.addMenu("Research")
-        researchAuthorAction = researchMenu.addAction("Author")
-        researchTitleAction = researchMenu.addAction("Title")
-        contextMenu.addSeparator()
-        showAction = contextMenu.addAction("Show in Folder")
-        sendToDeviceAction = contextMenu.addAction("Send to Device")
-        contextMenu.addSeparator()
-        deleteAction = contextMenu.addAction("Delete...")
-
         # Disable 'Send to Device' if Kindle is not connected
-        if not self.isKindleConnected:
-            sendToDeviceAction.setDisabled(True)
+        self.sendToDeviceAction.setEnabled(self.isKindleConnected)
 
-        action = contextMenu.exec(self.viewport().mapToGlobal(pos))
+        action = self.contextMenu.exec(self.viewport().mapToGlobal(pos))
 
         # Handle the selected action
-        if action == openAction:
+        if action == self.openAction:
             self.handleOpenAction(pos)
-        elif action == editAction:
+        elif action == self.editAction:
             self.handleEditAction(pos)
-        elif action == researchAuthorAction:
+        elif action == self.researchAuthorAction:
             self.handleResearchAuthorAction(pos)
-        elif action == researchTitleAction:
+        elif action == self.researchTitleAction:
             self.handleResearchTitleAction(pos)
-        elif action == deleteAction:
+        elif action == self.deleteAction:
             self.handleDeleteAction()
-        elif action == showAction:
+        elif action == self.showAction:
             self.handleShowAction(pos)
-        elif action == sendToDeviceAction:
+        elif action == self.sendToDeviceAction:
             self.handleSendToDeviceAction()
 
+    def bookFromIndex(self, index):
+        """
+        Get the book displayed at a view index.
+
+        :param index: The index in the view.
+        :type index: QModelIndex
+        :return: The book at the index.
+        :rtype: Book
+        """
+        proxyModel = cast(MultiColumnSortProxyModel, self.model())
+        sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
+        return sourceModel.bookAt(proxyModel.mapToSource(index).row())
+
     def handleEditAction(self, pos):
         """
         Open the edit dialog for the selected book.
@@ -93,16 +103,7 @@ class LibraryTableView(QTableView):
         if not index.isValid():
             return
 
-        proxyModel = cast(MultiColumnSortProxyModel, self.model())
-        sourceIndex = proxyModel.mapToSource(index)
-        sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
-
-        bookId = sourceModel.data(
-            sourceIndex.siblingAtColumn(sourceModel.headers.index('ID')),
-            Qt.ItemDataRole.DisplayRole
-        )
-
-        book = sourceModel.library.getBookById(bookId)
+        book = self.bookFromIndex(index)
         if book:
             editDialog = EditBookDialog(book)
             editDialog.closed.connect(self.onDialogClosed)
@@ -119,16 +120,7 @@ class LibraryTableView(QTableView):
         if not index.isValid():
             return
 
-        proxyModel = cast(MultiColumnSortProxyModel, self.model())
-        sourceIndex = proxyModel.mapToSource(index)
-        sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
-
-        bookId = sourceModel.data(
-            sourceIndex.siblingAtColumn(sourceModel.headers.index('ID')),
-            Qt.ItemDataRole.DisplayRole
-        )
-
-        book = sourceModel.library.getBookById(bookId)
+        book = self.bookFromIndex(index)
         author = book.author
 
         urlEncodedAuthorName = urllib.parse.quote(author)
@@ -146,16 +138,7 @@ class LibraryTableView(QTableView):
         if not index.isValid():
             return
 
-        proxyModel = cast(MultiColumnSortProxyModel, self.model())
-        sourceIndex = proxyModel.mapToSource(index)
-        sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
-
-        bookId = sourceModel.data(
-            sourceIndex.siblingAtColumn(sourceModel.headers.index('ID')),
-            Qt.ItemDataRole.DisplayRole
-        )
-
-        book = sourceModel.library.getBookById(bookId)
+        book = self.bookFromIndex(index)
         title = book.title
 
         urlEncodedTitle = urllib.parse.quote(title)
@@ -187,23 +170,26 @@ class LibraryTableView(QTableView):
         proxyModel = cast(MultiColumnSortProxyModel, self.model())
         sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
 
-        # Sort indexes in reverse order to prevent index shifts when deleting
-        for index in sorted(selectedIndexes, reverse=True, key=lambda idx: idx.row()):
-            sourceIndex = proxyModel.mapToSource(index)
+        # Collect the IDs of all selected books, then remove them in a single batch
+        bookIds = [sourceModel.bookAt(row).id for row in self.selectedSourceRows()]
+        sourceModel.library.removeBooks(bookIds)
 
-            idColumn = sourceModel.headers.index('ID')
-            bookId = sourceModel.data(
-                sourceIndex.siblingAtColumn(idColumn),
-                Qt.ItemDataRole.DisplayRole
-            )
+    def selectedSourceRows(self) -> list[int]:
+        """
+        Get the source model rows of the selected books.
+
+        The selection is walked range by range rather than index by index.
 
-            book = sourceModel.library.getBookById(bookId)
-            sourceModel.library.removeBook(book)
-            sourceModel.removeRow(sourceIndex.row())
+        :return: The selected rows in the source model.
+        :rtype: list[int]
+        """
+        proxyModel = cast(MultiColumnSortProxyModel, self.model())
+        selection = proxyModel.mapSelectionToSource(self.selectionModel().selection())
 
-        # Reset the model after deletion
-        self.model().beginResetModel()
-        self.model().endResetModel()
+        rows = set()
+        for selectionRange in selection:
+            rows.update(range(selectionRange.top(), selectionRange.bottom() + 1))
+        return sorted(rows)
 
     def handleOpenAction(self, pos):
         """
@@ -216,16 +202,7 @@ class LibraryTableView(QTableView):
         if not index.isValid():
             return
 
-        proxyModel = cast(MultiColumnSortProxyModel, self.model())
-        sourceIndex = proxyModel.mapToSource(index)
-        sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
-
-        bookId = sourceModel.data(
-            sourceIndex.siblingAtColumn(sourceModel.headers.index('ID')),
-            Qt.ItemDataRole.DisplayRole
-        )
-
-        book = sourceModel.library.getBookById(bookId)
+        book = self.bookFromIndex(index)
 
         QDesktopServices.openUrl(QUrl.fromLocalFile(book.path))
 
@@ -240,16 +217,7 @@ class LibraryTableView(QTableView):
         if not index.isValid():
             return
 
-        proxyModel = cast(MultiColumnSortProxyModel, self.model())
-        sourceIndex = proxyModel.mapToSource(index)
-        sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
-
-        bookId = sourceModel.data(
-            sourceIndex.siblingAtColumn(sourceModel.headers.index('ID')),
-            Qt.ItemDataRole.DisplayRole
-        )
-
-        book = sourceModel.library.getBookById(bookId)
+        book = self.bookFromIndex(index)
         path = book.path
 
         QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.dirname(path)))
@@ -258,29 +226,18 @@ class LibraryTableView(QTableView):
         """
         Send selected books to the connected Kindle device.
         """
-        selectedIndexes = self.selectionModel().selectedRows()
-        if not selectedIndexes:
+        selectedRows = self.selectedSourceRows()
+        if not selectedRows:
             return
 
-        booksNotAlreadyOnDevice = []
-
-        for index in selectedIndexes:
-            proxyModel = cast(MultiColumnSortProxyModel, self.model())
-            sourceIndex = proxyModel.mapToSource(index)
-            sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
-
-            bookId = sourceModel.data(
-                sourceIndex.siblingAtColumn(sourceModel.headers.index('ID')),
-                Qt.ItemDataRole.DisplayRole
-            )
+        proxyModel = cast(MultiColumnSortProxyModel, self.model())
+        sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
 
-            book = sourceModel.library.getBookById(bookId)
+        booksNotAlreadyOnDevice = []
 
-            onDevice = sourceModel.data(
-                sourceIndex.siblingAtColumn(sourceModel.headers.index('On Device')),
-                Qt.ItemDataRole.DisplayRole
-            )
-            if onDevice != "✓":
+        for row in selectedRows:
+            book = sourceModel.bookAt(row)
+            if not sourceModel.onDevice.get(book.id):
                 booksNotAlreadyOnDevice.append(book)
 
         if not booksNotAlreadyOnDevice:
@@ -299,6 +256,7 @@ class LibraryTableView(QTableView):
         sourceModel = cast(LibraryTableModel, proxyModel.sourceModel())
 
         sourceModel.library.updateBook(book)
+        sourceModel.updateBook(book)
 
     def setKindleConnected(self, connected):
         """
@@ -5,7 +5,7 @@ from PySide6.QtCore import QUrl
 from PySide6.QtGui import QIcon, QDesktopServices, QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import QMainWindow, QTabWidget, QFileDialog, QMessageBox, QWidget, QVBoxLayout
 
-from src.books.core.constants import ebookExtensions, ebookExtensionsFilterString
+from src.books.core.constants import ebookSuffixes, ebookExtensionsFilterString
 from src.books.core.config import Config
 from src.books.core.library import Library
 from src.books.core.log import Log
@@ -56,7 +56,7 @@ class MainWindow(QMainWindow):
 
         # Configure Library tab
         self.libraryTab = LibraryTab(self._library, self)
-        self.libraryTab.bookRemoved.connect(self.updateLibraryTabTitle)
+        self.libraryTab.booksRemoved.connect(self.updateLibraryTabTitle)
         self.libraryTab.sendToDeviceRequested.connect(self.sendBooksToDevice)
         self.tabs.addTab(self.libraryTab, "Library")
         self.updateLibraryTabTitle()
@@ -101,7 +101,7 @@ class MainWindow(QMainWindow):
         self._downloadThread.start()
 
         # Initialize and configure Kindle device monitoring thread
-        self.kindleMonitorThread = KindleMonitorThread()
+        self.kindleMonitorThread = KindleMonitorThread(self._library.config)
         self.kindleMonitorThread.booksChanged.connect(self.libraryTab.kindleBooksChanged)
         self.kindleMonitorThread.kindleConnected.connect(self.libraryTab.kindleConnected)
         self.kindleMonitorThread.kindleDisconnected.connect(self.libraryTab.kindleDisconnected)
@@ -177,6 +177,9 @@ class MainWindow(QMainWindow):
             self.kindleMonitorThread.stop()
             self.kindleMonitorThread.wait()
 
+        # Fold the library's journal into books.json
+        self._library.compact()
+
         super().closeEvent(event)
 
     def updateLibraryTabTitle(self):
@@ -290,9 +293,7 @@ class MainWindow(QMainWindow):
         allFiles = []
         for root, dirs, files in os.walk(directory):
             for file in files:
-                extension = os.path.splitext(file)[1].lower()
-                validExtensions = [f".{ext}" for ext in ebookExtensions]
-                if extension in validExtensions:
+                if file.lower().endswith(ebookSuffixes):
                     filePath = os.path.join(root, file)
                     allFiles.append(filePath)
 
@@ -338,14 +339,14 @@ class MainWindow(QMainWindow):
             self.libraryTab.refreshTable()
             self.importCounter = 0
 
-    def importError(self, book):
+    def importError(self, filePath):
         """
         Handle an error during the import of a book.
 
-        :param book: The book object that caused the import error.
-        :type book: Book
+        :param filePath: The path to the file that could not be imported.
+        :type filePath: str
         """
-        self.statusBar().showMessage(f"Error importing {book.title} by {book.author}")
+        self.statusBar().showMessage(f"Error importing {os.path.basename(filePath)}")
 
     def importFinished(self):
         """
@@ -439,9 +440,7 @@ class MainWindow(QMainWindow):
             urls = event.mimeData().urls()
             for url in urls:
                 if url.isLocalFile():
-                    extension = os.path.splitext(url.toLocalFile())[1].lower()
-                    validExtensions = [f".{ext}" for ext in ebookExtensions]
-                    if extension in validExtensions:
+                    if url.toLocalFile().lower().endswith(ebookSuffixes):
                         event.accept()
                         return
         event.ignore()
@@ -458,9 +457,7 @@ class MainWindow(QMainWindow):
             urls = event.mimeData().urls()
             for url in urls:
                 if url.isLocalFile():
-                    extension = os.path.splitext(url.toLocalFile())[1].lower()
-                    validExtensions = [f".{ext}" for ext in ebookExtensions]
-                    if extension in validExtensions:
+                    if url.toLocalFile().lower().endswith(ebookSuffixes):
                         filePaths.append(url.toLocalFile())
             if filePaths:
                 self.doImport(filePaths)